@@ -0,0 +1,172 @@
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from importlib.util import find_spec
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from bytes_parser import (
+    BitField,
+    BitFlag,
+    ChecksumValidator,
+    Frame,
+    Row,
+    SubFrame,
+    __version__,
+)
+from bytes_parser.composite_frame import CompositeFrame
+
+
+def custom_parser(row: Row, *args, **kwargs) -> int:
+    return int.from_bytes(row.raw_val, row.byte_order) * args[0] \
+        + kwargs.get('offset', 0)
+
+
+def make_frames() -> dict[str, Frame]:
+    sizes: list[int] = [1, 2, 4, 8, 3]
+    return {
+        'small': Frame('small', [Row(f'F{i}', sizes[i % 4], min_value=0,
+                                     max_value=1000)
+                                 for i in range(8)], 'little'),
+        'large': Frame('large', [Row(f'F{i}', sizes[i % 5],
+                                     'X' if i % 3 else 'd', signed=bool(i % 2))
+                                 for i in range(200)], 'little'),
+        'bits': Frame('bits', [
+            Row('STATUS', 16, 'X', bit_fields=[
+                *[BitFlag(i, f'FLAG{i}', bool(i % 2)) for i in range(112)],
+                BitField(112, 'COUNTER', 8, max_value=200),
+                BitField(120, 'MODE', 8)]),
+            Row('CRC8', 1, 'X')]),
+        'float': Frame('float', [Row(f'T{i}', 4, '.2f', min_value=-100,
+                                     max_value=100)
+                                 for i in range(50)], 'little'),
+        'custom': Frame('custom', [Row(f'C{i}', 4, parser=custom_parser,
+                                       args=(2,), kwargs={'offset': i})
+                                   for i in range(20)]),
+        'tail': Frame('tail', [*[Row(f'H{i}', 2) for i in range(6)],
+                               Row('PAYLOAD', 0, 'X')]),
+        'subframe': Frame('subframe', [
+            row for i in range(20)
+            for row in SubFrame([Row('U', 2, min_value=0, max_value=5000),
+                                 Row('I', 2, signed=True),
+                                 Row('T', 1)], prefix=f'CH{i}_')]),
+        'checksum': Frame('checksum', [
+            Row('HEADER', 4, 'X'), Row('DATA', 58),
+            Row('CRC16', 2, 'X', validator=ChecksumValidator('crc16_modbus',
+                                                             start=4))],
+            'little'),
+    }
+
+
+def measure(func: Callable[[], object], count: int,
+            repeat: int) -> dict[str, float]:
+    elapsed: float = float('inf')
+    for _ in range(repeat):
+        start: float = time.perf_counter()
+        func()
+        elapsed = min(elapsed, time.perf_counter() - start)
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {'seconds': elapsed, 'frames_per_second': count / elapsed,
+            'peak_memory_kb': peak / 1024}
+
+
+def frame_benchmarks(frame: Frame, count: int,
+                     numpy: bool) -> dict[str, Callable[[], object]]:
+    # zero-size tail rows get 32 extra bytes
+    size: int = frame.full_size + 32 * any(row.size == 0 for row in frame.rows)
+    rnd = random.Random(0)
+    capture: list[bytes] = [rnd.randbytes(size) for _ in range(count)]
+    header: list[str] = frame._get_table_header()
+    columns: list[str] = list(dict.fromkeys([header[0], header[-1]]))
+    benchmarks: dict[str, Callable[[], object]] = {
+        'parse': lambda: [frame.parse(raw) for raw in capture],
+        'parse_tuple': lambda: [frame.parse_tuple(raw) for raw in capture],
+        'parse_table': lambda: frame.parse_table(capture),
+        # first and last table columns, failing frames only
+        'parse_table_where': lambda: frame.parse_table(
+            capture, columns=columns, where='failures'),
+    }
+    if numpy:
+        benchmarks['parse_table_numpy'] = \
+            lambda: frame.parse_table(capture, engine='numpy')
+    return benchmarks
+
+
+def assembly_benchmarks(count: int) -> dict[str, Callable[[], object]]:
+    first = Frame('first', [Row(f'A{i}', 2) for i in range(10)], 'little')
+    second = Frame('second', [Row(f'B{i}', 4) for i in range(10)], 'little')
+    target = Frame('target', [*[Row(f'A{i}', 2) for i in range(0, 10, 2)],
+                              *[Row(f'B{i}', 4) for i in range(0, 10, 2)]],
+                   'little')
+    composite = CompositeFrame('composite', {
+        'first': [Row(f'A{i}', 2) for i in range(5)],
+        'second': [Row(f'B{i}', 4) for i in range(5)]}, 'little')
+    rnd = random.Random(0)
+    first.parse(rnd.randbytes(first.full_size))
+    second.parse(rnd.randbytes(second.full_size))
+    return {
+        'from_frames': lambda: [target.from_frames(first, second)
+                                for _ in range(count)],
+        'composite_from_frames': lambda: [composite.from_frames(first, second)
+                                          for _ in range(count)],
+    }
+
+
+def definition_benchmarks(count: int) -> dict[str, Callable[[], object]]:
+    # peak memory is taken by frame definitions kept alive in the list
+    return {'build': lambda: [make_frames() for _ in range(count)]}
+
+
+def main() -> None:
+    args = argparse.ArgumentParser(description='bytes_parser benchmarks')
+    args.add_argument('-n', '--count', type=int, default=2000,
+                      help='frames per benchmark')
+    args.add_argument('-r', '--repeat', type=int, default=3,
+                      help='timing repeats, best time is reported')
+    args.add_argument('-o', '--output', type=Path, default=None,
+                      help='write JSON results to file')
+    args.add_argument('-k', '--filter', default='',
+                      help='run only benchmarks containing substring')
+    options = args.parse_args()
+    has_numpy: bool = find_spec('numpy') is not None
+    from loguru import logger
+    logger.remove()
+    benchmarks: dict[str, tuple[Callable[[], object], int]] = {}
+    for name, frame in make_frames().items():
+        for op, func in frame_benchmarks(frame, options.count,
+                                         has_numpy).items():
+            benchmarks[f'{name}.{op}'] = (func, options.count)
+    for op, func in assembly_benchmarks(options.count).items():
+        benchmarks[f'assembly.{op}'] = (func, options.count)
+    definitions: int = max(options.count // 100, 1)
+    for op, func in definition_benchmarks(definitions).items():
+        benchmarks[f'definitions.{op}'] = (func,
+                                           definitions * len(make_frames()))
+    results: list[dict] = []
+    for name, (func, count) in benchmarks.items():
+        if options.filter not in name:
+            continue
+        result: dict = {'name': name, 'count': count,
+                        **measure(func, count, options.repeat)}
+        results.append(result)
+        print(f'{name:<35} {result["frames_per_second"]:>12.0f} fps '\
+              f'{result["peak_memory_kb"]:>10.0f} KiB')
+    report: dict = {'version': __version__,
+                    'python': platform.python_version(),
+                    'platform': platform.platform(),
+                    'results': results}
+    if options.output:
+        options.output.write_text(json.dumps(report, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -1,5 +1,13 @@
+from .aggregate import Aggregator, FieldStats  # noqa: F401
+from .array_row import RowArray  # noqa: F401
 from .bitfields import BitField, BitFlag  # noqa: F401
+from .checksum import ChecksumValidator  # noqa: F401
+from .export import TableWriter  # noqa: F401
 from .frame import Frame  # noqa: F401
+from .framer import Framer, FramingResult  # noqa: F401
+from .loader import load_frames  # noqa: F401
+from .result import ErrorCounter, FrameResult  # noqa: F401
+from .router import FrameRouter  # noqa: F401
 from .row import Row  # noqa: F401
 from .subframe import SubFrame  # noqa: F401
 
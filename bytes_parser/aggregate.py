@@ -0,0 +1,152 @@
+import math
+import threading
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+if TYPE_CHECKING:
+    from bytes_parser.result import FrameResult, RowResult
+
+
+class FieldStats(NamedTuple):
+    count: int
+    failures: int
+    min: int | float
+    max: int | float
+    mean: float
+    last: int | float | None
+
+    @property
+    def failure_rate(self) -> float:
+        return self.failures / self.count if self.count else 0.0
+
+
+class Aggregator:
+    # running statistics indexed by Frame table header column
+    def __init__(self, header: Sequence[str]) -> None:
+        self._lock = threading.Lock()
+        self.header: list[str] = list(header)
+        self.reset()
+
+    def __getstate__(self) -> dict:
+        return {key: value for key, value in self.__dict__.items()
+                if key != '_lock'}
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def reset(self) -> None:
+        size: int = len(self.header)
+        with self._lock:
+            self.frames: int = 0
+            self.counts: list[int] = [0] * size
+            self.failures: list[int] = [0] * size
+            self.mins: list[int | float] = [math.inf] * size
+            self.maxs: list[int | float] = [-math.inf] * size
+            self.sums: list[int | float] = [0] * size
+            self.lasts: list[int | float | None] = [None] * size
+
+    def _add(self, column: int, value: float, is_valid: bool) -> None:
+        self.counts[column] += 1
+        self.failures[column] += not is_valid
+        self.mins[column] = min(self.mins[column], value)
+        self.maxs[column] = max(self.maxs[column], value)
+        self.sums[column] += value
+        self.lasts[column] = value
+
+    def _add_count(self, column: int, is_valid: bool) -> None:
+        # values without order (RowArray tuples)
+        self.counts[column] += 1
+        self.failures[column] += not is_valid
+
+    def update_result(self, result: "FrameResult") -> None:
+        with self._lock:
+            self.frames += 1
+            for row_result in result.rows:
+                row = row_result.row
+                if row._width != 1 or isinstance(row_result._parsed_val,
+                                                 tuple):
+                    self._update_array(row_result)
+                    continue
+                self._add(row._column, row_result._parsed_val,
+                          row_result._is_valid)
+                bits = row_result._repr_bit_list
+                for bit in bits:
+                    self._add(bit.bit._column, bit._value, bit.is_valid)
+                if len(bits) < len(row.bit_fields):
+                    # valid BitFlags are not kept in results unless all_bits
+                    shown: set[int] = {bit.bit._column for bit in bits}
+                    for flag in row.bit_fields:
+                        if flag._column not in shown:
+                            self._add(flag._column, int(flag.ok_condition),
+                                      True)
+
+    def _update_array(self, row_result: "RowResult") -> None:
+        column: int = row_result.row._column
+        if not row_result._expanded:
+            self._add_count(column, row_result._is_valid)
+            return
+        values: tuple = row_result._parsed_val  # type: ignore
+        valid: list[bool] = row_result._elements_valid or \
+                            [True] * len(values)
+        for offset, (value, is_valid) in enumerate(zip(values, valid)):
+            self._add(column + offset, value, is_valid)
+
+    def update_columns(self, values: Sequence[Sequence],
+                       valid: Sequence[Sequence]) -> None:
+        with self._lock:
+            for column, (column_values, column_valid) in \
+                    enumerate(zip(values, valid)):
+                count: int = len(column_values)
+                if not count:
+                    continue
+                if column == 0:
+                    self.frames += count
+                self.counts[column] += count
+                if isinstance(column_values[0], tuple):
+                    self.failures[column] += count - int(sum(column_valid))
+                    continue
+                if hasattr(column_values, 'dtype'):
+                    low, high, total = column_values.min(), \
+                        column_values.max(), column_values.sum(dtype='f8')
+                else:
+                    low, high, total = min(column_values), \
+                        max(column_values), sum(column_values)
+                self.failures[column] += count - int(sum(column_valid))
+                self.mins[column] = min(self.mins[column], _item(low))
+                self.maxs[column] = max(self.maxs[column], _item(high))
+                self.sums[column] += _item(total)
+                self.lasts[column] = _item(column_values[-1])
+
+    def merge(self, other: "Aggregator") -> "Aggregator":
+        # other is treated as the newer one for last values
+        if other.header != self.header:
+            raise ValueError(f'Incorrect Aggregator header size '\
+                             f'{len(other.header)} != {len(self.header)}')
+        with self._lock:
+            self.frames += other.frames
+            for column in range(len(self.header)):
+                if not other.counts[column]:
+                    continue
+                self.counts[column] += other.counts[column]
+                self.failures[column] += other.failures[column]
+                self.mins[column] = min(self.mins[column], other.mins[column])
+                self.maxs[column] = max(self.maxs[column], other.maxs[column])
+                self.sums[column] += other.sums[column]
+                self.lasts[column] = other.lasts[column]
+        return self
+
+    def snapshot(self) -> dict[str, FieldStats]:
+        with self._lock:
+            # mean is not defined for RowArray tuples (last is None)
+            return {label: FieldStats(count, failures, low, high,
+                                      total / count if last is not None
+                                      else math.nan, last)
+                    for label, count, failures, low, high, total, last
+                    in zip(self.header, self.counts, self.failures, self.mins,
+                           self.maxs, self.sums, self.lasts)}
+
+
+def _item(value: Any) -> int | float:
+    # numpy scalars to python numbers
+    return value.item() if hasattr(value, 'item') else value
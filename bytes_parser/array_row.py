@@ -0,0 +1,169 @@
+import struct
+from time import perf_counter
+from typing import TYPE_CHECKING, Literal
+
+from bytes_parser.result import ErrorCounter, FrameResult, RowResult, forward_attributes
+from bytes_parser.row import Row
+from bytes_parser.struct_plan import struct_code
+from bytes_parser.subframe import SubFrame
+
+if TYPE_CHECKING:
+    from bytes_parser.profiler import Profiler
+
+
+def _format(field: Row, value: float) -> str:
+    str_format: str = field.str_format
+    if isinstance(value, float) and str_format == 'd':
+        str_format = '.2f'
+    return f'{field.prefix}{value:{str_format}}'
+
+
+def parse_array(field: RowResult, *args, **kwargs) -> tuple:
+    return field._parsed_val  # type: ignore
+
+
+def validate_array(field: RowResult, *args, **kwargs) -> bool:
+    return field._is_valid
+
+
+def represent_array(field: RowResult, *args, **kwargs) -> str:
+    row: RowArray = field.row  # type: ignore
+    return '[' + ', '.join(_format(element, value) for element, value
+                           in zip(row._elements, field._parsed_val)) + ']'  # type: ignore
+
+
+class RowArray(Row):
+    # count repetitions of a Row or SubFrame record decoded with one struct
+    # call; values are a flat tuple, expand gives a table column per element
+    def __init__(self, label: str, template: Row | SubFrame | list[Row],
+                 count: int, expand: bool = False,
+                 byte_order: Literal['big', 'little'] = '') -> None:  # type: ignore
+        if isinstance(template, Row):
+            fields: list[Row] = [template]
+        elif isinstance(template, SubFrame):
+            fields = list(template.rows)
+        else:
+            fields = list(template)
+        if count <= 0 or not fields:
+            raise ValueError(f'Incorrect RowArray {label} definition')
+        for field in fields:
+            if field.bit_fields or struct_code(field) is None:
+                raise ValueError(f'RowArray {label} element {field.label} '\
+                                 f'must use default handlers, 1, 2, 4 or 8 '\
+                                 f'bytes size and no bit fields')
+        super().__init__(label, sum(field.size for field in fields) * count,
+                         parser=parse_array, validator=validate_array,
+                         representer=represent_array)
+        self.fields: list[Row] = fields
+        self.count: int = count
+        self.expand: bool = expand
+        self._elements: list[Row] = fields * count
+        if expand:
+            self._width = len(self._elements)
+        if len(fields) == 1:
+            self._labels: list[str] = [f'{label}{i}' for i in range(count)]
+        else:
+            self._labels = [f'{label}{i}_{field.label}'
+                            for i in range(count) for field in fields]
+        offsets: list[int] = []
+        offset: int = 0
+        for field in self._elements:
+            offsets.append(offset)
+            offset += field.size
+        self._element_offsets: list[int] = offsets
+        self._mins: tuple[float, ...] = tuple(field.min_value
+                                              for field in self._elements)
+        self._maxs: tuple[float, ...] = tuple(field.max_value
+                                              for field in self._elements)
+        self._bounded: bool = any(field.min_value != float('-inf') or
+                                  field.max_value != float('inf')
+                                  for field in fields)
+        self._struct: struct.Struct | None = None
+        if byte_order:
+            self._set_byte_order(byte_order)
+
+    def _set_byte_order(self, byte_order: Literal['big', 'little']) -> None:
+        self.byte_order = byte_order
+        for field in self.fields:
+            if not field.byte_order:
+                field._set_byte_order(byte_order)
+        orders: set[str] = {field.byte_order for field in self.fields}
+        if len(orders) > 1:
+            raise ValueError(f'RowArray {self.label} elements have different '\
+                             f'byte order')
+        codes: str = ''.join(struct_code(field)  # type: ignore
+                             for field in self.fields)
+        self._struct = struct.Struct(
+            ('<', '>')[orders.pop() == 'big'] + codes * self.count)
+
+    def __getstate__(self) -> tuple[dict, dict]:
+        # Row fields are slots, RowArray attributes are in __dict__
+        state, slots = super().__getstate__()  # type: ignore
+        return {**state, '_struct': None}, slots
+
+    def __setstate__(self, state: tuple[dict, dict]) -> None:
+        self.__dict__.update(state[0])
+        for name, value in state[1].items():
+            setattr(self, name, value)
+        if self.byte_order:
+            self._set_byte_order(self.byte_order)
+
+    def _set_prefix(self) -> None:
+        for field in self.fields:
+            field._set_prefix()
+
+    def _parse(self, raw_data: bytes, errors: ErrorCounter,
+               all_bits: bool = False,
+               parent: FrameResult | None = None) -> RowResult:
+        raw_val: bytes = raw_data[self._offset: self._offset + self.size]
+        if len(raw_val) < self.size:
+            raw_val = bytes(raw_val).ljust(self.size, b'\x00')
+        result = RowResult(self, raw_val, parent)
+        result._expanded = self.expand
+        values: tuple = self._struct.unpack_from(raw_val)  # type: ignore
+        result._parsed_val = values  # type: ignore
+        if self._bounded:
+            valid: list[bool] = [low <= value <= high for value, low, high
+                                 in zip(values, self._mins, self._maxs)]
+            result._elements_valid = valid
+            result._is_valid = all(valid)
+        if self.expand:
+            if not result._is_valid:
+                for column, is_valid in enumerate(valid, self._column):
+                    if not is_valid:
+                        errors.add(column)
+            result._elements_errors = \
+                errors.counts[self._column: self._column + self._width]
+        elif not result._is_valid:
+            result._errors = errors.add(self._column)
+        else:
+            result._errors = errors[self._column]
+        return result
+
+    def _parse_profiled(self, raw_data: bytes, value: float | None,
+                        errors: ErrorCounter, all_bits: bool,
+                        parent: FrameResult, profiler: "Profiler") -> RowResult:
+        start: float = perf_counter()
+        result: RowResult = self._parse(raw_data, errors, all_bits, parent)
+        result._profiler = profiler
+        profiler.record(self.label, 'parser', perf_counter() - start,
+                        not result._is_valid)
+        return result
+
+    def _element_tuples(self, result: RowResult,
+                        with_repr: bool = True) -> list[tuple]:
+        values: tuple = result._parsed_val  # type: ignore
+        valid: list[bool] = result._elements_valid or [True] * len(values)
+        errors: list[int] = result._elements_errors or [0] * len(values)
+        if not with_repr:
+            return list(zip(self._labels, values, valid, errors))
+        raw_val: bytes = result.raw_val
+        return [(label, _format(element, value), value,
+                 f'0x{raw_val[offset: offset + element.size].hex().upper()}',
+                 is_valid, error)
+                for label, element, value, offset, is_valid, error
+                in zip(self._labels, self._elements, values,
+                       self._element_offsets, valid, errors)]
+
+
+forward_attributes(RowResult, 'row', ('fields', 'count', 'expand'))
@@ -0,0 +1,52 @@
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from bytes_parser.row import Row
+
+
+class AssemblyPlan:
+    # copy segments (source index, source offset, target offset, size)
+    def __init__(self, size: int, sources: int) -> None:
+        self.size: int = size
+        self.segments: list[tuple[int, int, int, int]] = []
+        self.min_sizes: list[int] = [0] * sources
+
+    def add(self, index: int, source_row: "Row", target_offset: int) -> None:
+        offset: int = source_row._offset
+        size: int = source_row.size
+        self.min_sizes[index] = max(self.min_sizes[index], offset + size)
+        if self.segments:
+            last_index, last_src, last_dst, last_size = self.segments[-1]
+            if last_index == index and last_src + last_size == offset \
+               and last_dst + last_size == target_offset:
+                self.segments[-1] = (index, last_src, last_dst,
+                                     last_size + size)
+                return
+        self.segments.append((index, offset, target_offset, size))
+
+    def check(self, sources: Sequence[bytes]) -> bool:
+        return len(sources) >= len(self.min_sizes) and \
+               all(len(source) >= size
+                   for source, size in zip(sources, self.min_sizes))
+
+    def assemble(self, sources: Sequence[bytes]) -> bytes | None:
+        if not self.check(sources):
+            return None
+        buffer = bytearray(self.size)
+        for index, src, dst, size in self.segments:
+            buffer[dst: dst + size] = memoryview(sources[index])[src: src + size]
+        return bytes(buffer)
+
+    def assemble_many(self, sources: Sequence[Sequence[bytes]]) -> bytes | None:
+        # back-to-back frames in a single preallocated buffer
+        buffer = bytearray(self.size * len(sources))
+        view = memoryview(buffer)
+        for i, frame_sources in enumerate(sources):
+            if not self.check(frame_sources):
+                return None
+            base: int = i * self.size
+            for index, src, dst, size in self.segments:
+                view[base + dst: base + dst + size] = \
+                    memoryview(frame_sources[index])[src: src + size]
+        return bytes(buffer)
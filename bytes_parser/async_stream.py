@@ -0,0 +1,42 @@
+import asyncio
+from collections.abc import AsyncIterator
+
+from loguru import logger
+
+
+async def read_block(reader: asyncio.StreamReader, frame_size: int,
+                     count: int, timeout: float | None = None) -> list[bytes]:
+    # waits for the first frame, then collects up to count frames
+    # until timeout between frames is exceeded
+    frames: list[bytes] = []
+    while len(frames) < count:
+        try:
+            if frames and timeout is not None:
+                frame: bytes = await asyncio.wait_for(
+                    reader.readexactly(frame_size), timeout)
+            else:
+                frame = await reader.readexactly(frame_size)
+        except TimeoutError:
+            break
+        except asyncio.IncompleteReadError as err:
+            if err.partial:
+                logger.warning(f'Skipped incomplete frame at the end of the '\
+                               f'stream ({len(err.partial)} of {frame_size} '\
+                               f'bytes)')
+            break
+        frames.append(frame)
+    return frames
+
+
+async def aiter_frames(reader: asyncio.StreamReader, frame_size: int,
+                       frames_per_block: int = 1,
+                       timeout: float | None = None) -> AsyncIterator[list[bytes]]:
+    if frame_size <= 0:
+        raise ValueError(f'Incorrect frame size {frame_size} for stream reading')
+    count: int = max(frames_per_block, 1)
+    while True:
+        frames: list[bytes] = await read_block(reader, frame_size, count,
+                                               timeout)
+        if not frames:
+            return
+        yield frames
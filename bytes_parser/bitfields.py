@@ -1,30 +1,46 @@
+from array import array
 from collections.abc import Callable
-from typing import Literal
+from typing import TYPE_CHECKING, Literal
+
+if TYPE_CHECKING:
+    from bytes_parser.frame import Frame
 
 
 class BitFlag:
+    __slots__ = ('_column', '_label', '_parent_frame', 'label', 'ok_condition',
+                 'pos', 'show')
+
     def __init__(self, pos: int, label: str, ok_condition: bool,
                  show: Literal['always', 'error'] = 'error') -> None:
         self.pos: int = pos
         self.label: str = label
         self.ok_condition: bool = ok_condition
-        self.is_valid: bool = True
         self.show: Literal['always', 'error'] = show
-        self._repr_label: str = f'    $[{self.pos}]{self.label}'
-        self._value: int = -1  # not for user!
-        self._raw: bytes = b''
-        self._repr: str = '' # not for user!
-        self.errors = 0
+        self._column: int = 0
+        self._parent_frame: Frame | None = None
+        self._label: str | None = None
+
+    @property
+    def _repr_label(self) -> str:
+        # built on first table output only
+        if self._label is None:
+            self._label = f'    $[{self.pos}]{self.label}'
+        return self._label
+
+    @property
+    def errors(self) -> int:
+        if self._parent_frame is None:
+            return 0
+        return self._parent_frame.errors[self._column]
 
     def get_pos_range(self) -> list[int]:
         return [self.pos]
 
-    def get_tuple(self) -> tuple[str, str, int, str, bool, int]:
-        return (self._repr_label, self._repr, self._value,
-                f'0x{self._raw.hex().upper()}',
-                self.is_valid, self.errors)
-
 class BitField:
+    __slots__ = ('_column', '_label', '_parent_frame', 'label', 'length',
+                 'max_value', 'min_value', 'parser', 'pos', 'representer',
+                 'show', 'str_format', 'validator')
+
     def __init__(self, pos: int, label: str, length: int = 1,
                  str_format: str = 'd',
                  max_value: float = float('inf'),
@@ -38,7 +54,6 @@ class BitField:
         self.length: int = length
         self.str_format: str = str_format
         self.show: Literal['always', 'error'] = show
-        self.errors = 0
         if self.length < 1:
             raise ValueError('BitField length must be bigger then 0')
         self.max_value: float = max_value
@@ -46,17 +61,71 @@ class BitField:
         self.parser: Callable[[BitField], int | float] | None = parser
         self.representer: Callable[[BitField], str] | None = representer
         self.validator: Callable[[BitField], bool] | None = validator
-        self.is_valid: bool = True
-        self._repr_label: str = f'    $[{self.pos}:{self.pos + self.length}]'\
-                                f'{self.label}'
-        self._value: int | float = 0
-        self._raw: bytes = b''
-        self._repr: str = ''
+        self._column: int = 0
+        self._parent_frame: Frame | None = None
+        self._label: str | None = None
+
+    @property
+    def _repr_label(self) -> str:
+        if self._label is None:
+            self._label = f'    $[{self.pos}:{self.pos + self.length}]'\
+                          f'{self.label}'
+        return self._label
+
+    @property
+    def errors(self) -> int:
+        if self._parent_frame is None:
+            return 0
+        return self._parent_frame.errors[self._column]
 
     def get_pos_range(self) -> list[int]:
         return list(range(self.pos, self.pos + self.length))
 
-    def get_tuple(self) -> tuple[str, str, int | float, str, bool, int]:
-        return (self._repr_label, self._repr, self._value,
-                f'0x{self._raw.hex().upper()}',
-                self.is_valid, self.errors)
+
+class BitPlan:
+    # packed positions and lengths of Row.bit_fields, computed once by Frame;
+    # bit i has table column column + i, length 0 marks BitFlag
+    __slots__ = ('always_mask', 'bits', 'column', 'fields', 'flag_index',
+                 'flags_mask', 'lengths', 'ok_mask', 'positions')
+
+    def __init__(self, bits: list[BitField | BitFlag], row_column: int
+                 ) -> None:
+        self.bits: list[BitField | BitFlag] = bits
+        self.column: int = row_column + 1
+        self.positions: array[int] = array('H')
+        self.lengths: array[int] = array('H')
+        self.fields: array[int] = array('H')
+        self.flag_index: array[int] = array('h')
+        self.flags_mask: int = 0
+        self.ok_mask: int = 0
+        self.always_mask: int = 0
+        for index, bit in enumerate(bits):
+            self.positions.append(bit.pos)
+            if isinstance(bit, BitFlag):
+                self.lengths.append(0)
+                if len(self.flag_index) <= bit.pos:
+                    self.flag_index.extend([-1] * (bit.pos + 1 -
+                                                   len(self.flag_index)))
+                self.flag_index[bit.pos] = index
+                self.flags_mask |= 1 << bit.pos
+                if bit.ok_condition:
+                    self.ok_mask |= 1 << bit.pos
+                if bit.show == 'always':
+                    self.always_mask |= 1 << bit.pos
+            elif isinstance(bit, BitField):
+                self.lengths.append(bit.length)
+                self.fields.append(index)
+            else:
+                raise TypeError(f'Incorrect bitfield type: {type(bit)}')
+
+    def flagged(self, val: int) -> list[int]:
+        # indices of failed or always shown BitFlags and all BitFields
+        candidates: int = ((val ^ self.ok_mask) | self.always_mask) & \
+                          self.flags_mask
+        indices: list[int] = list(self.fields)
+        while candidates:
+            low: int = candidates & -candidates
+            candidates ^= low
+            indices.append(self.flag_index[low.bit_length() - 1])
+        indices.sort()
+        return indices
@@ -0,0 +1,42 @@
+import mmap
+from typing import Any
+
+# bytes-like object: bytes, bytearray, memoryview, mmap, 1-d NumPy array
+Buffer = bytes | bytearray | memoryview | mmap.mmap | Any
+
+
+def is_buffer(data: Any) -> bool:
+    if isinstance(data, (bytes, bytearray, memoryview, mmap.mmap)):
+        return True
+    return getattr(data, 'ndim', None) == 1
+
+
+def as_view(data: Buffer) -> memoryview:
+    view = memoryview(data)
+    if view.format != 'B' or view.ndim != 1:
+        view = view.cast('B')
+    return view
+
+
+def frame_data(raw_data: Buffer | str, offset: int = 0,
+               size: int = 0) -> bytes | memoryview:
+    # bytes are used as is, other buffers are sliced without copying
+    if isinstance(raw_data, str):
+        raw_data = bytes.fromhex(raw_data)
+    if isinstance(raw_data, bytes) and not offset:
+        return raw_data
+    view: memoryview = as_view(raw_data)
+    if not offset:
+        return view
+    if size > 0:
+        return view[offset: offset + size]
+    return view[offset:]
+
+
+def split_frames(data: Buffer, size: int, offset: int = 0
+                 ) -> tuple[memoryview, list[memoryview], int]:
+    # returns capture view, frame views and incomplete tail size
+    view: memoryview = as_view(data)[offset:]
+    count, tail = divmod(len(view), size)
+    view = view[:count * size]
+    return view, [view[i: i + size] for i in range(0, len(view), size)], tail
@@ -0,0 +1,73 @@
+import threading
+from collections import OrderedDict
+from typing import Generic, NamedTuple, TypeVar
+
+from bytes_parser.result import ErrorCounter
+
+T = TypeVar('T')
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class NullErrorCounter(ErrorCounter):
+    # used to decode cached values; real counters are updated on every hit
+    def __init__(self) -> None:
+        super().__init__(0)
+
+    def add(self, column: int, count: int = 1) -> int:
+        return 0
+
+    def __getitem__(self, column: int) -> int:
+        return 0
+
+
+NULL_ERRORS = NullErrorCounter()
+
+
+class RowCache(Generic[T]):
+    def __init__(self, maxsize: int) -> None:
+        if maxsize <= 0:
+            raise ValueError(f'Incorrect cache size {maxsize}')
+        self.maxsize: int = maxsize
+        self.hits: int = 0
+        self.misses: int = 0
+        self._data: OrderedDict[bytes, T] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> dict:
+        # cached results are not stored
+        return {'maxsize': self.maxsize}
+
+    def __setstate__(self, state: dict) -> None:
+        self.__init__(state['maxsize'])  # type: ignore
+
+    def get(self, key: bytes) -> T | None:
+        with self._lock:
+            value: T | None = self._data.get(key, None)
+            if value is None:
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: bytes, value: T) -> None:
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def info(self) -> CacheInfo:
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._data))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
@@ -0,0 +1,167 @@
+import binascii
+import zlib
+from collections.abc import Sequence
+from functools import reduce
+from operator import xor
+from typing import TYPE_CHECKING, Any, Literal
+
+if TYPE_CHECKING:
+    from bytes_parser.result import RowResult
+    from bytes_parser.row import Row
+
+
+def _reflect(value: int, width: int) -> int:
+    return int(f'{value:0{width}b}'[::-1], 2)
+
+
+class Crc:
+    # table driven CRC, Rocksoft model parameters with refin == refout
+    def __init__(self, width: int, poly: int, init: int = 0,
+                 reflect: bool = False, xor_out: int = 0) -> None:
+        if width not in (8, 16, 32):
+            raise ValueError(f'Incorrect CRC width: {width}')
+        self.width: int = width
+        self.poly: int = poly
+        self.init: int = init
+        self.reflect: bool = reflect
+        self.xor_out: int = xor_out
+        self.mask: int = (1 << width) - 1
+        self._init: int = _reflect(init, width) if reflect else init
+        self.table: list[int] = []
+        for i in range(256):
+            if reflect:
+                crc: int = i
+                rpoly: int = _reflect(poly, width)
+                for _ in range(8):
+                    crc = (crc >> 1) ^ rpoly if crc & 1 else crc >> 1
+            else:
+                crc = i << (width - 8)
+                top: int = 1 << (width - 1)
+                for _ in range(8):
+                    crc = (crc << 1) ^ poly if crc & top else crc << 1
+            self.table.append(crc & self.mask)
+        # C implementations of the same tables in the standard library
+        self._native: Literal['', 'zlib', 'hqx'] = ''
+        if (width, poly, init, reflect, xor_out) == \
+           (32, 0x04C11DB7, 0xFFFFFFFF, True, 0xFFFFFFFF):
+            self._native = 'zlib'
+        elif (width, poly, reflect, xor_out) == (16, 0x1021, False, 0):
+            self._native = 'hqx'
+
+    def __call__(self, data: bytes | memoryview) -> int:
+        if self._native == 'zlib':
+            return zlib.crc32(data)
+        if self._native == 'hqx':
+            return binascii.crc_hqx(data, self.init)
+        table: list[int] = self.table
+        crc: int = self._init
+        if self.reflect:
+            for byte in data:
+                crc = table[(crc ^ byte) & 0xFF] ^ (crc >> 8)
+        elif self.width == 8:
+            for byte in data:
+                crc = table[crc ^ byte]
+        else:
+            shift: int = self.width - 8
+            mask: int = self.mask
+            for byte in data:
+                crc = table[((crc >> shift) ^ byte) & 0xFF] ^ \
+                      ((crc << 8) & mask)
+        return crc ^ self.xor_out
+
+    def batch(self, matrix: Any) -> Any:
+        # uint8 matrix (frames x bytes) -> uint64 CRC per frame; one table
+        # lookup per byte column over all frames
+        import numpy as np
+        table = np.asarray(self.table, dtype=np.uint64)
+        crc = np.full(len(matrix), self._init, dtype=np.uint64)
+        shift = np.uint64(self.width - 8)
+        mask = np.uint64(self.mask)
+        for i in range(matrix.shape[1]):
+            column = matrix[:, i].astype(np.uint64)
+            if self.reflect:
+                crc = table[(crc ^ column) & np.uint64(0xFF)] ^ \
+                      (crc >> np.uint64(8))
+            else:
+                crc = table[((crc >> shift) ^ column) & np.uint64(0xFF)] ^ \
+                      ((crc << np.uint64(8)) & mask)
+        return crc ^ np.uint64(self.xor_out)
+
+
+class Sum:
+    # sum of bytes modulo 2 ** width
+    def __init__(self, width: int = 8) -> None:
+        self.width: int = width
+        self.mask: int = (1 << width) - 1
+
+    def __call__(self, data: bytes | memoryview) -> int:
+        return sum(data) & self.mask
+
+    def batch(self, matrix: Any) -> Any:
+        import numpy as np
+        return matrix.sum(axis=1, dtype=np.uint64) & np.uint64(self.mask)
+
+
+class Xor:
+    def __call__(self, data: bytes | memoryview) -> int:
+        return reduce(xor, data, 0)
+
+    def batch(self, matrix: Any) -> Any:
+        import numpy as np
+        if not matrix.shape[1]:
+            return np.zeros(len(matrix), dtype=np.uint64)
+        return np.bitwise_xor.reduce(matrix, axis=1).astype(np.uint64)
+
+
+Algorithm = Crc | Sum | Xor
+
+ALGORITHMS: dict[str, Algorithm] = {
+    'crc8': Crc(8, 0x07),
+    'crc8_maxim': Crc(8, 0x31, reflect=True),
+    'crc16': Crc(16, 0x8005, reflect=True),
+    'crc16_modbus': Crc(16, 0x8005, 0xFFFF, reflect=True),
+    'crc16_ccitt': Crc(16, 0x1021, 0xFFFF),
+    'crc16_xmodem': Crc(16, 0x1021),
+    'crc32': Crc(32, 0x04C11DB7, 0xFFFFFFFF, True, 0xFFFFFFFF),
+    'sum8': Sum(8),
+    'sum16': Sum(16),
+    'xor8': Xor(),
+}
+
+
+def get_algorithm(name: str | Algorithm) -> Algorithm:
+    if not isinstance(name, str):
+        return name
+    found: Algorithm | None = ALGORITHMS.get(name.lower(), None)
+    if found is None:
+        raise ValueError(f'Unknown checksum algorithm {name!r}, expected '\
+                         f'one of {list(ALGORITHMS)}')
+    return found
+
+
+class ChecksumValidator:
+    # Row validator: row value == checksum of frame bytes [start, end);
+    # end defaults to the row offset (trailer rows)
+    def __init__(self, algorithm: str | Algorithm = 'crc8', start: int = 0,
+                 end: int | None = None) -> None:
+        self.algorithm: Algorithm = get_algorithm(algorithm)
+        self.start: int = start
+        self.end: int | None = end
+
+    def span(self, row: "Row") -> tuple[int, int]:
+        return self.start, row._offset if self.end is None else self.end
+
+    def __call__(self, field: "RowResult", *args, **kwargs) -> bool:
+        parent = field._parent_frame
+        if parent is None:
+            raise ValueError(f'Checksum row {field.row.label} is parsed '\
+                             f'without its frame')
+        start, end = self.span(field.row)
+        return self.algorithm(parent.raw_data[start: end]) == field._parsed_val
+
+    def check(self, row: "Row", matrix: Any, values: Sequence) -> Any:
+        # batched validation of a frames x bytes uint8 matrix
+        import numpy as np
+        start, end = self.span(row)
+        return self.algorithm.batch(matrix[:, start: end]) == \
+            np.asarray(values).astype(np.uint64)
@@ -1,9 +1,12 @@
-from typing import Literal
+from collections.abc import Sequence
+from typing import Any, Literal
 
 from loguru import logger
-from pandas import DataFrame
 
-from bytes_parser.frame import Frame
+from bytes_parser.assembly import AssemblyPlan
+from bytes_parser.frame import Frame, assemble_table, last_results
+from bytes_parser.output import Output
+from bytes_parser.result import FrameResult
 from bytes_parser.row import Row
 
 
@@ -13,32 +16,62 @@ class CompositeFrame:
         self.frame_type: str = frame_type
         self.rules: dict[str, list[Row]] = rules
         self.rows: list[Row] = []
+        self._source_labels: dict[str, list[tuple[Row, str]]] = {}
         for frame_label, rows in rules.items():
             for row in rows:
+                self._source_labels.setdefault(frame_label, [])\
+                    .append((row, row.label))
                 row.label = f'{frame_label} {row.label}'
                 self.rows.append(row)
         self.frame = Frame(frame_type, self.rows, byte_order)
+        self._assembly_plans: dict[tuple[Frame, ...], AssemblyPlan] = {}
 
-    def from_frames(self, *frames: Frame) -> None | DataFrame:
-        raw_data: bytes = b''
-        for frame_type, rows in self.rules.items():
-            filtered: list = [f for f in frames if f.frame_type == frame_type]
-            if not filtered:
+    def _compile_assembly(self, sources: Sequence[Frame]) -> AssemblyPlan | None:
+        plan: AssemblyPlan | None = self._assembly_plans.get(tuple(sources))
+        if plan is not None:
+            return plan
+        plan = AssemblyPlan(self.frame.full_size, len(sources))
+        frame_types: list[str] = [frame.frame_type for frame in sources]
+        for frame_type, rows in self._source_labels.items():
+            if frame_type not in frame_types:
                 logger.error(f'Frame {frame_type} not found in incoming '\
-                             f'frames: {[f.frame_type for f in frames]}')
+                             f'frames: {frame_types}')
                 return None
-            frame: Frame = filtered[0]
-            for row in rows:
-                label: str = row.label[len(frame.frame_type + " "):]
-                frame_row: Row | None = frame.rows_dict.get(label, None)
-                if not frame_row:
-                    labels: list[str] = [frame.frame_type for frame in frames]
-                    logger.error(f'Row {row.label} not found in {labels} '\
+            index: int = frame_types.index(frame_type)
+            for row, label in rows:
+                source_row: Row | None = sources[index].rows_dict.get(label,
+                                                                      None)
+                if not source_row:
+                    logger.error(f'Row {row.label} not found in {frame_types} '\
                                  f'for {frame_type}')
                     return None
-                raw_data += frame_row.raw_val
-        if len(raw_data) != self.frame.full_size:
-            logger.error(f'Failed to assemble frame. Incorrect size '\
-                         f'{len(raw_data)} != {self.frame.full_size}')
+                if source_row.size != row.size:
+                    logger.error(f'Failed to assemble frame. Row {row.label} '\
+                                 f'size {source_row.size} != {row.size}')
+                    return None
+                plan.add(index, source_row, row._offset)
+        self._assembly_plans[tuple(sources)] = plan
+        return plan
+
+    def from_frames(self, *frames: Frame | FrameResult,
+                    output: Output = 'dataframe') -> Any:
+        results: list[FrameResult] = last_results(frames)
+        plan: AssemblyPlan | None = self._compile_assembly(
+            [result.frame for result in results])
+        if plan is None:
+            return None
+        raw_data: bytes | None = plan.assemble([result.raw_data
+                                                for result in results])
+        if raw_data is None:
+            logger.error('Failed to assemble frame. Incorrect source size')
+            return None
+        return self.frame.parse(raw_data, output)
+
+    def from_frames_table(self, frames: Sequence[Frame],
+                          raw_rows: Sequence[Sequence[bytes]],
+                          engine: Literal['python', 'numpy'] = 'python',
+                          output: Output = 'dataframe') -> tuple[Any, Any] | None:
+        plan: AssemblyPlan | None = self._compile_assembly(frames)
+        if plan is None:
             return None
-        return self.frame.parse(raw_data)
+        return assemble_table(self.frame, plan, raw_rows, engine, output)
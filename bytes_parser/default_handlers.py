@@ -1,76 +1,127 @@
 import math
 import struct
-from collections.abc import Sequence
-from typing import TYPE_CHECKING
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Literal
 
-from bytes_parser import BitFlag
-from bytes_parser.bitfields import BitField
+from bytes_parser.bitfields import BitField, BitFlag, BitPlan
+from bytes_parser.result import BitResult
 
 if TYPE_CHECKING:
+    from bytes_parser.result import ErrorCounter, RowResult
     from bytes_parser.row import Row
 
 
-def bit_fields(row: "Row",
-               all_bits: bool = False) -> Sequence[BitField | BitFlag]:
-    repr_list: list[BitField | BitFlag] = []
-    for bit in row.bit_fields:
-        val: int = int.from_bytes(row.raw_val, byteorder=row.byte_order)
-        if isinstance(bit, BitFlag):
-            bit._value = ((val & (0x01 << bit.pos)) >> bit.pos)
-            bit._raw = bit._value.to_bytes()
-            bit.is_valid = bit.ok_condition == bit._value
-            if not bit.is_valid:
-                bit.errors += 1
-            if bit.is_valid and bit.show != 'always' and not all_bits:
-                continue
-            bit._repr = f'{bit._value}'
-            repr_list.append(bit)
-        elif isinstance(bit, BitField):
-            mask: int = 0
-            mask = [mask := mask | (1 << i) for i in range(bit.length)][-1]
-            bit._value = (val >> bit.pos) & mask
-            bit._raw = bit._value.to_bytes(math.ceil(bit.length / 8),
-                                           row.byte_order)
-            if bit.parser:
-                bit._value = bit.parser(bit)
-            if bit.validator:
-                bit.is_valid = bit.validator(bit)
-            else:
-                bit.is_valid = bit.min_value < bit._value < bit.max_value
-            if not bit.is_valid:
-                bit.errors += 1
-            if bit.representer:
-                bit._repr = bit.representer(bit)
-            else:
-                if bit.str_format == 'd' and isinstance(bit._value, float):
-                    bit.str_format = 'f'
-                bit._repr = f'{bit._value:{bit.str_format}}'
-            repr_list.append(bit)
-        else:
-            raise TypeError(f'Incorrect bitfield type: {type(bit)}')
+_FLAG_RAW: tuple[bytes, bytes] = (b'\x00', b'\x01')
+
+
+def bit_fields(row: "Row", raw_val: bytes, errors: "ErrorCounter",
+               all_bits: bool = False) -> list[BitResult]:
+    plan: BitPlan = row._bit_plan
+    val: int = int.from_bytes(raw_val, byteorder=row.byte_order)
+    indices: Iterable[int] = range(len(plan.bits)) if all_bits \
+                             else plan.flagged(val)
+    bits, lengths, positions = plan.bits, plan.lengths, plan.positions
+    column: int = plan.column
+    repr_list: list[BitResult] = []
+    for index in indices:
+        bit: BitField | BitFlag = bits[index]
+        length: int = lengths[index]
+        if length:
+            repr_list.append(parse_bit_field(bit, val, row.byte_order,  # type: ignore
+                                             errors, column + index,
+                                             (1 << length) - 1,
+                                             (length + 7) // 8))
+            continue
+        value: int = (val >> positions[index]) & 1
+        repr_list.append(parse_bit_flag(bit, value,  # type: ignore
+                                        bit.ok_condition == value,  # type: ignore
+                                        errors, column + index))
     return repr_list
 
 
-def parse(field: "Row", *args, **kwargs) -> int | float:
-    result: int | float = 0
-    if 'f' in field.str_format and field.size == 4:
-        bytes_order: str = ["<", ">"][field.byte_order == "big"]
-        result = struct.unpack(f'{bytes_order}f', field.raw_val)[0]
-    else:
-        result = int.from_bytes(field.raw_val, field.byte_order,
-                                signed=field.signed)
+def changed_bits(row: "Row", raw_val: bytes, prev_raw: bytes | None,
+                 errors: "ErrorCounter") -> list[BitResult]:
+    plan: BitPlan = row._bit_plan
+    val: int = int.from_bytes(raw_val, byteorder=row.byte_order)
+    prev: int = val if prev_raw is None else \
+                int.from_bytes(prev_raw, byteorder=row.byte_order)
+    results: list[BitResult] = []
+    candidates: int = ((val ^ plan.ok_mask) | (val ^ prev)) & plan.flags_mask
+    while candidates:
+        low: int = candidates & -candidates
+        candidates ^= low
+        pos: int = low.bit_length() - 1
+        index: int = plan.flag_index[pos]
+        flag: BitFlag = plan.bits[index]  # type: ignore
+        value: int = (val >> pos) & 1
+        results.append(parse_bit_flag(flag, value, flag.ok_condition == value,
+                                      errors, plan.column + index))
+    for index in plan.fields:
+        bit: BitField = plan.bits[index]  # type: ignore
+        mask: int = (1 << bit.length) - 1
+        result: BitResult = parse_bit_field(bit, val, row.byte_order,
+                                            errors, plan.column + index, mask,
+                                            (bit.length + 7) // 8)
+        if not result.is_valid or (val ^ prev) & (mask << bit.pos):
+            results.append(result)
+    results.sort(key=lambda result: result.bit._column)
+    return results
+
+
+def parse_bit_flag(bit: BitFlag, value: int, is_valid: bool,
+                   errors: "ErrorCounter", column: int) -> BitResult:
+    result = BitResult(bit)
+    result._value = value
+    result._raw = _FLAG_RAW[value]
+    result.is_valid = is_valid
+    result.errors = errors[column] if is_valid else errors.add(column)
     return result
 
 
-def represent(field: "Row", *args, **kwargs) -> str:
-    if isinstance(field._parsed_val, float) and field.str_format == 'd':
-        field.str_format = '.2f'
-    result: str = f"{field.prefix}{field._parsed_val:{field.str_format}}"
+def parse_bit_field(bit: BitField, val: int,
+                    byte_order: Literal['big', 'little'],
+                    errors: "ErrorCounter", column: int,
+                    mask: int | None = None, size: int = 0) -> BitResult:
+    result = BitResult(bit)
+    if mask is None:
+        mask = (1 << bit.length) - 1
+    result._value = (val >> bit.pos) & mask
+    result._raw = result._value.to_bytes(size or math.ceil(bit.length / 8),
+                                         byte_order)
+    if bit.parser:
+        result._value = bit.parser(result)
+    if bit.validator:
+        result.is_valid = bit.validator(result)
+    else:
+        result.is_valid = bit.min_value < result._value < bit.max_value
+    if not result.is_valid:
+        result.errors = errors.add(column)
+    else:
+        result.errors = errors[column]
     return result
 
 
-def validate(field: "Row", *args, **kwargs) -> bool:
+def parse(field: "RowResult", *args, **kwargs) -> int | float:
+    # definition attributes are read from field.row directly, forwarding
+    # through RowResult.__getattr__ is slow on the default path
+    row: Row = field.row
+    if 'f' in row.str_format and row.size == 4:
+        bytes_order: str = ["<", ">"][row.byte_order == "big"]
+        return struct.unpack(f'{bytes_order}f', field.raw_val)[0]
+    return int.from_bytes(field.raw_val, row.byte_order, signed=row.signed)
+
+
+def represent(field: "RowResult", *args, **kwargs) -> str:
+    row: Row = field.row
+    str_format: str = row.str_format
+    if isinstance(field._parsed_val, float) and str_format == 'd':
+        str_format = '.2f'
+    return f"{row.prefix}{field._parsed_val:{str_format}}"
+
+
+def validate(field: "RowResult", *args, **kwargs) -> bool:
+    row: Row = field.row
     try:
-        return field.min_value <= field._parsed_val <= field.max_value
+        return row.min_value <= field._parsed_val <= row.max_value
     except Exception:  # noqa: BLE001
         return True
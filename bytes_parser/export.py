@@ -0,0 +1,199 @@
+import csv
+from collections.abc import Iterable, Sequence
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Literal, Self
+
+from bytes_parser.array_row import RowArray
+from bytes_parser.bitfields import BitField, BitFlag
+from bytes_parser.buffer import Buffer, is_buffer, split_frames
+from bytes_parser.checksum import ChecksumValidator
+from bytes_parser.default_handlers import parse
+from bytes_parser.result import ErrorCounter
+from bytes_parser.stream import Source, iter_frames
+from bytes_parser.struct_plan import is_default_row, struct_code
+
+if TYPE_CHECKING:
+    from bytes_parser.frame import Frame
+    from bytes_parser.row import Row
+
+Format = Literal['parquet', 'arrow', 'csv']
+VALID_SUFFIX: str = ' IsOK'
+_FORMATS: dict[str, Format] = {'.parquet': 'parquet', '.arrow': 'arrow',
+                               '.feather': 'arrow', '.ipc': 'arrow',
+                               '.csv': 'csv'}
+
+
+def _uint_type(bits: int) -> str:
+    for size in (8, 16, 32, 64):
+        if bits <= size:
+            return f'uint{size}'
+    return 'string'
+
+
+def row_type(row: "Row") -> str:
+    code: str | None = struct_code(row)
+    if code == 'f':
+        return 'float32'
+    if code:
+        return f'{("uint", "int")[row.signed]}{row.size * 8}'
+    if row.parser is parse and isinstance(row.validator, ChecksumValidator):
+        return _uint_type(row.size * 8)
+    if not is_default_row(row):
+        return 'float64'
+    if 'f' in row.str_format and row.size == 4:
+        return 'float32'
+    if 0 < row.size <= 8:
+        return ('uint64', 'int64')[row.signed]
+    # wider integers do not fit into fixed width columns
+    return 'string'
+
+
+def bit_type(bit: BitField | BitFlag) -> str:
+    if isinstance(bit, BitFlag):
+        return 'uint8'
+    if bit.parser:
+        return 'float64'
+    return _uint_type(bit.length)
+
+
+def array_types(row: RowArray) -> list[str]:
+    if row.expand:
+        return [row_type(element) for element in row._elements]
+    kinds: set[str] = {row_type(field) for field in row.fields}
+    return [f'list<{kinds.pop() if len(kinds) == 1 else "float64"}>']
+
+
+def table_schema(frame: "Frame") -> list[tuple[str, str]]:
+    # value column and validity column per table header column
+    types: list[str] = []
+    for row in frame.rows:
+        if isinstance(row, RowArray):
+            types.extend(array_types(row))
+            continue
+        types.append(row_type(row))
+        types.extend(bit_type(bit) for bit in row.bit_fields)
+    header: list[str] = frame._get_table_header()
+    if len(set(header)) != len(header):
+        raise ValueError(f'Frame {frame.frame_type} has duplicated columns')
+    schema: list[tuple[str, str]] = []
+    for name, kind in zip(header, types):
+        schema.extend(((name, kind), (f'{name}{VALID_SUFFIX}', 'bool')))
+    return schema
+
+
+class TableWriter:
+    def __init__(self, frame: "Frame", path: str | Path,
+                 file_format: Format | None = None,
+                 engine: Literal['python', 'numpy'] = 'python',
+                 errors: ErrorCounter | None = None) -> None:
+        self.frame: Frame = frame
+        self.path: Path = Path(path)
+        if file_format is None:
+            file_format = _FORMATS.get(self.path.suffix.lower(), None)
+            if file_format is None:
+                raise ValueError(f'Unknown export format for {self.path}')
+        if file_format not in ('parquet', 'arrow', 'csv'):
+            raise ValueError(f'Incorrect export format: {file_format}')
+        self.file_format: Format = file_format
+        self.engine: Literal['python', 'numpy'] = engine
+        self.errors: ErrorCounter | None = errors
+        self.schema: list[tuple[str, str]] = table_schema(frame)
+        self.frames: int = 0
+        self._header: list[str] = frame._get_table_header()
+        self._writer: Any = None
+        self._file: Any = None
+        if file_format == 'csv':
+            self._file = open(self.path, 'w', newline='')  # noqa: SIM115
+            self._writer = csv.writer(self._file)
+            self._writer.writerow([name for name, _ in self.schema])
+        else:
+            self._open_arrow()
+
+    def _open_arrow(self) -> None:
+        try:
+            import pyarrow as pa
+        except ImportError as err:
+            raise ImportError(f'pyarrow is required for {self.file_format} '\
+                              f'export') from err
+        self._arrow_schema = pa.schema([(name, _arrow_type(pa, kind))
+                                        for name, kind in self.schema])
+        if self.file_format == 'parquet':
+            import pyarrow.parquet as pq
+            self._writer = pq.ParquetWriter(self.path, self._arrow_schema)
+        else:
+            self._writer = pa.ipc.new_file(self.path, self._arrow_schema)
+
+    def write(self, raw_rows: Sequence[Buffer] | Sequence[str] | Buffer) -> int:
+        # parses one chunk of frames and appends it to the file
+        values, valid = self.frame.parse_table(raw_rows, self.engine,
+                                               'columns', self.errors)
+        columns: list[Sequence] = []
+        for name in self._header:
+            columns.extend((values[name], valid[name]))
+        count: int = len(columns[0]) if columns else 0
+        if not count:
+            return 0
+        if self.file_format == 'csv':
+            self._writer.writerows(zip(*columns))
+        else:
+            import pyarrow as pa
+            arrays: list = [pa.array(_column(column, kind), _arrow_type(pa, kind))
+                            for column, (_, kind) in zip(columns, self.schema)]
+            self._writer.write_table(pa.Table.from_arrays(
+                arrays, schema=self._arrow_schema))
+        self.frames += count
+        return count
+
+    def write_chunks(self, chunks: Iterable[Sequence[Buffer] | Buffer]) -> int:
+        return sum(self.write(chunk) for chunk in chunks)
+
+    def write_stream(self, source: Source, chunk_size: int = 10000) -> int:
+        return self.write_chunks(iter_frames(source, self.frame.full_size,
+                                             chunk_size))
+
+    def write_capture(self, capture: Buffer, chunk_size: int = 10000) -> int:
+        # back-to-back frames are sliced into chunks without copying
+        if self.frame.full_size <= 0:
+            raise ValueError(f'Frame {self.frame.frame_type} has no fixed size')
+        view, _, _ = split_frames(capture, self.frame.full_size)
+        step: int = self.frame.full_size * max(chunk_size, 1)
+        return self.write_chunks(view[i: i + step]
+                                 for i in range(0, len(view), step))
+
+    def close(self) -> None:
+        if self._writer is not None and self.file_format != 'csv':
+            self._writer.close()
+        if self._file is not None:
+            self._file.close()
+        self._writer = None
+        self._file = None
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *_args) -> None:
+        self.close()
+
+
+def _arrow_type(pa: Any, kind: str) -> Any:
+    if kind.startswith('list<'):
+        return pa.list_(_arrow_type(pa, kind[5:-1]))
+    return getattr(pa, kind)() if kind != 'bool' else pa.bool_()
+
+
+def _column(column: Sequence, kind: str) -> Sequence:
+    if kind == 'string':
+        return [str(value) for value in column]
+    return column
+
+
+def export(frame: "Frame", source: Source | Buffer | Iterable[Sequence[Buffer]],
+           path: str | Path, file_format: Format | None = None,
+           chunk_size: int = 10000,
+           engine: Literal['python', 'numpy'] = 'python') -> int:
+    with TableWriter(frame, path, file_format, engine) as writer:
+        if is_buffer(source):
+            return writer.write_capture(source, chunk_size)
+        if hasattr(source, 'read') or hasattr(source, 'recv'):
+            return writer.write_stream(source, chunk_size)  # type: ignore
+        return writer.write_chunks(source)  # type: ignore
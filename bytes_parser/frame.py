@@ -1,13 +1,33 @@
+import asyncio
 import inspect
-from collections.abc import Sequence
+from collections import Counter
+from collections.abc import AsyncIterator, Iterable, Iterator, Sequence
 from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
+from time import perf_counter
 from typing import TYPE_CHECKING, Any, Literal
 
 from loguru import logger
-from pandas import DataFrame
+
+from bytes_parser.aggregate import Aggregator
+from bytes_parser.assembly import AssemblyPlan
+from bytes_parser.async_stream import aiter_frames
+from bytes_parser.bitfields import BitPlan
+from bytes_parser.buffer import Buffer, frame_data, is_buffer, split_frames
+from bytes_parser.cache import CacheInfo, RowCache
+from bytes_parser.checksum import ChecksumValidator
+from bytes_parser.output import Output, rows_output, table_from_columns, table_from_rows
+from bytes_parser.profiler import Hook, Profiler, StageStats
+from bytes_parser.projection import Projection, Where, check_where
+from bytes_parser.result import BitResult, ErrorCounter, FrameResult
+from bytes_parser.stream import Source, iter_frames
+from bytes_parser.struct_plan import StructPlan, is_default_row
 
 if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+    from bytes_parser.export import Format
     from bytes_parser.row import Row
 
 
@@ -22,28 +42,54 @@ def _initialization_location() -> Location | None:
     while frame:
         if frame.f_code.co_name == '<module>':
             return Location(frame.f_globals['__name__'],
-                            Path(frame.f_globals['__file__']))
+                            Path(frame.f_globals.get('__file__', '')))
         frame = frame.f_back
 
 
+def last_results(frames: Sequence["Frame | FrameResult"]) -> list[FrameResult]:
+    results: list[FrameResult] = []
+    for frame in frames:
+        result: FrameResult | None = frame if isinstance(frame, FrameResult) \
+                                     else frame._last_result
+        if result is not None:
+            results.append(result)
+    return results
+
+
 class Frame:
     def __init__(self, frame_type: str, rows: list["Row"],
                  byte_order: Literal['big', 'little'] = 'big',
                  use_frame_type_as_header: bool = True,
-                 show_bits: Literal['auto', 'always'] = 'auto') -> None:
+                 show_bits: Literal['auto', 'always'] = 'auto',
+                 location: Location | None = None) -> None:
         self._location: Location
+        if location is not None:
+            self._location = location
         self.frame_type: str = frame_type
         self.rows: list[Row] = rows
         self.rows_dict: dict[str, Row] = {row.label: row for row in self.rows}
+        self._rows_index: dict[str, int] = {row.label: i for i, row
+                                            in enumerate(self.rows)}
         self.full_size: int = sum(row.size for row in self.rows)
         self._byte_order = byte_order
+        self._last_result: FrameResult | None = None
+        self._assembly_plans: dict[tuple[Frame, ...], AssemblyPlan] = {}
+        self._projections: dict[tuple[str, ...] | None, Projection] = {}
+        self._profiler: Profiler | None = None
+        self.aggregator: Aggregator | None = None
+        column: int = 0
         for row in self.rows:
             if not row.byte_order:
                 row._set_byte_order(byte_order)
             row._set_prefix()
             row._parent_frame = self
+            row._column = column
+            column += row._width
             bits: list[int] = []
             for bit in row.bit_fields:
+                bit._parent_frame = self
+                bit._column = column
+                column += 1
                 bits.extend(bit.get_pos_range())
                 if show_bits == 'always':
                     bit.show = 'always'
@@ -52,15 +98,44 @@ class Frame:
             if bits and  max(bits) > row.size * 8 - 1:
                 raise ValueError(f'BitField overflow position '\
                                  f'value {max(bits)}')
+            row._bit_plan = BitPlan(row.bit_fields, row._column)
+            if row.cache_size > 0:
+                if isinstance(row.validator, ChecksumValidator):
+                    # checksum depends on the whole frame, not on row bytes
+                    raise ValueError(f'Checksum row {row.label} can not be '\
+                                     f'cached')
+                row._cache = RowCache(row.cache_size)
+            row._copy_raw = not is_default_row(row)
         self.use_frame_type_as_header: bool = use_frame_type_as_header
         self.update_offsets()
         self.check_labels()
+        self._struct_plan: StructPlan = StructPlan(self.rows)
+        self.errors: ErrorCounter = ErrorCounter(column)
+        self._bit_rows: list[Row] = [row for row in self.rows
+                                     if row.bit_fields and row.size > 0]
+        # zero-size row takes the rest of raw_data
+        self._variable_size: bool = any(row.size == 0 for row in self.rows)
 
-    def __new__(cls, *_args, **_kwargs):
+    def __new__(cls, *args, **kwargs):
         obj = super().__new__(cls)
-        obj._location = _initialization_location()  # type: ignore
+        # no arguments when unpickled, location is restored from state
+        if (args or kwargs) and kwargs.get('location', None) is None:
+            obj._location = _initialization_location()  # type: ignore
         return obj
 
+    def __getstate__(self) -> dict:
+        state: dict = self.__dict__.copy()
+        state['_last_result'] = None
+        state['_assembly_plans'] = {}
+        state['_projections'] = {}
+        state['_profiler'] = None
+        del state['_struct_plan']
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._struct_plan = StructPlan(self.rows)
+
     def get_location(self) -> Location:
         return self._location
 
@@ -70,16 +145,16 @@ class Frame:
         return self
 
     def check_labels(self):
-        labels: list[str] = [row.label for row in self.rows]
-        dups: list[str] = list(set(filter(lambda x: labels.count(x) > 1, labels)))
+        labels: Counter[str] = Counter(row.label for row in self.rows)
+        dups: list[str] = [label for label, count in labels.items()
+                           if count > 1]
         if dups:
             logger.warning(f'Frame {self.frame_type} has duplicated rows: {dups}')
 
     def __getitem__(self, key: str | int) -> Any:
-        if isinstance(key, int):
-            return self.rows[key]._parsed_val
-        else:
-            return self.rows_dict[key]._parsed_val
+        if self._last_result is None:
+            raise KeyError(f'Frame {self.frame_type} was not parsed yet')
+        return self._last_result[key]
 
     def update_offsets(self) -> None:
         offset = 0
@@ -87,88 +162,362 @@ class Frame:
             offset += prev_row.size
             row._offset = offset
 
-    def parse(self, raw_data: bytes | str) -> DataFrame:
-        if isinstance(raw_data, str):
-            raw_data = bytes.fromhex(raw_data)
-        table_rows: list[tuple] = self.parse_tuple(raw_data)
+    def parse(self, raw_data: Buffer | str, output: Output = 'dataframe',
+              errors: ErrorCounter | None = None,
+              with_repr: bool = True, offset: int = 0) -> Any:
+        table_rows: list[tuple] = self.parse_tuple(raw_data, errors, with_repr,
+                                                   offset)
         header: str = ('Name', self.frame_type)[self.use_frame_type_as_header]
-        return DataFrame(table_rows, columns=[header, 'Value', 'Numeric', 'Hex',
-                                              'IsOK', 'ErrCnt'])
+        if self._profiler is None:
+            return rows_output(table_rows, output, header, with_repr)
+        start: float = perf_counter()
+        table: Any = rows_output(table_rows, output, header, with_repr)
+        self._profiler.record(self.frame_type, 'output',
+                              perf_counter() - start)
+        return table
 
-    def parse_tuple(self, raw_data: bytes) -> list[tuple]:
-        table_rows: list[tuple] = []
-        if self.full_size != len(raw_data):
+    def parse_tuple(self, raw_data: Buffer | str,
+                    errors: ErrorCounter | None = None,
+                    with_repr: bool = True, offset: int = 0) -> list[tuple]:
+        return self.parse_result(raw_data, errors, offset=offset)\
+                   .to_tuples(with_repr)
+
+    def parse_result(self, raw_data: Buffer | str,
+                     errors: ErrorCounter | None = None,
+                     all_bits: bool = False, offset: int = 0) -> FrameResult:
+        # offset selects a frame inside a larger capture; the frame is copied
+        # once out of non-bytes buffers, so neither the result nor
+        # _last_result keep the caller's buffer exported (an mmap can not be
+        # closed), fields are still decoded through memoryview slices
+        raw_data = frame_data(raw_data, offset,
+                              0 if self._variable_size else self.full_size)
+        if not isinstance(raw_data, bytes):
+            raw_data = memoryview(bytes(raw_data))
+        if errors is None:
+            errors = self.errors
+        if self.full_size != len(raw_data) and \
+           (len(raw_data) < self.full_size or not self._variable_size):
             logger.warning(f'Frame {self.frame_type} size ({self.full_size}) '\
                            f'and raw_data ({len(raw_data)}) are different!')
-        for row in self.rows:
+        result = FrameResult(self, raw_data)
+        if self._profiler is not None:
+            self._parse_result_profiled(raw_data, errors, all_bits, result,
+                                        self._profiler)
+        else:
+            values: tuple | None = self._struct_plan.unpack(raw_data)
+            append = result.rows.append
+            for row, index in zip(self.rows, self._struct_plan.index):
+                try:
+                    if values is not None and index >= 0:
+                        append(row._parse_value(raw_data, values[index],
+                                                errors, all_bits, result))
+                    else:
+                        append(row._parse(raw_data, errors, all_bits, result))
+                except Exception as err:
+                    raise ValueError(f'Incorrect proccessing of {row.label} '\
+                                     f'label: {err}') from err
+        if self.aggregator is not None:
+            self.aggregator.update_result(result)
+        self._last_result = result
+        return result
+
+    def _parse_result_profiled(self, raw_data: bytes, errors: ErrorCounter,
+                               all_bits: bool, result: FrameResult,
+                               profiler: Profiler) -> FrameResult:
+        start: float = perf_counter()
+        values: tuple | None = self._struct_plan.unpack(raw_data)
+        profiler.record(self.frame_type, 'struct', perf_counter() - start)
+        for row, index in zip(self.rows, self._struct_plan.index):
+            value: int | float | None = None
+            if values is not None and index >= 0:
+                value = values[index]
             try:
-                table_rows.append(row._parse(raw_data))
-                if len(row._repr_bit_list):
-                    table_rows.extend([bit.get_tuple()
-                                       for bit in row._repr_bit_list])
+                result.rows.append(row._parse_profiled(raw_data, value, errors,
+                                                       all_bits, result,
+                                                       profiler))
             except Exception as err:
                 raise ValueError(f'Incorrect proccessing of {row.label} '\
                                  f'label: {err}') from err
-        return table_rows
+        return result
+
+    def enable_profiling(self, hook: Hook | None = None) -> Profiler:
+        self._profiler = Profiler(hook)
+        return self._profiler
+
+    def disable_profiling(self) -> None:
+        self._profiler = None
+
+    def attach_aggregator(self, aggregator: Aggregator | None = None
+                          ) -> Aggregator:
+        if aggregator is None:
+            aggregator = Aggregator(self._get_table_header())
+        elif len(aggregator.header) != len(self.errors):
+            raise ValueError(f'Incorrect Aggregator header size '\
+                             f'{len(aggregator.header)} != {len(self.errors)}')
+        self.aggregator = aggregator
+        return aggregator
+
+    def detach_aggregator(self) -> Aggregator | None:
+        aggregator: Aggregator | None = self.aggregator
+        self.aggregator = None
+        return aggregator
+
+    def profile_snapshot(self) -> dict[str, dict[str, StageStats]]:
+        if self._profiler is None:
+            return {}
+        return self._profiler.snapshot()
+
+    def parse_changed_bits(self, raw_data: Buffer | str,
+                           previous: Buffer | str | FrameResult | None = None,
+                           errors: ErrorCounter | None = None
+                           ) -> dict[str, list[BitResult]]:
+        raw_data = frame_data(raw_data)
+        if isinstance(previous, FrameResult):
+            previous = previous.raw_data
+        elif previous is not None:
+            previous = frame_data(previous)
+        if errors is None:
+            errors = self.errors
+        changed: dict[str, list[BitResult]] = {}
+        for row in self._bit_rows:
+            bits: list[BitResult] = row._parse_changed_bits(raw_data, previous,
+                                                            errors)
+            if bits:
+                changed[row.label] = bits
+        return changed
 
     def _get_table_header(self) -> list[str]:
         header: list[str] = []
         for row in self.rows:
+            if row._width != 1:
+                header.extend(row._labels)  # type: ignore
+                continue
             header.append(row.label)
             if len(row.bit_fields):
                 for bit in row.bit_fields:
                     header.append(f'    {row.label}: {bit.label}')
         return header
 
-    def parse_table(self, raw_rows: Sequence[bytes] | Sequence[str]) -> tuple[DataFrame, DataFrame]:
-        header: list[str] = self._get_table_header()
+    def parse_table(self, raw_rows: Sequence[Buffer] | Sequence[str] | Buffer,
+                    engine: Literal['python', 'numpy'] = 'python',
+                    output: Output = 'dataframe',
+                    errors: ErrorCounter | None = None,
+                    offset: int = 0, columns: Sequence[str] | None = None,
+                    where: Where | None = None) -> tuple[Any, Any]:
+        # a single buffer is treated as a capture of back-to-back frames;
+        # columns decodes only the selected table columns, where filters
+        # frames on them
+        if errors is None:
+            errors = self.errors
+        check_where(where)
+        projection: Projection | None = None
+        if columns is not None or where is not None:
+            projection = self._compile_projection(columns)
+            header: list[str] = projection.names
+        else:
+            header = self._get_table_header()
         table_rows: list[list[int | float]] = []
         valid_mask: list[list[bool]] = []
-        frames: list[bytes] = [bytes.fromhex(line)
-                               if isinstance(line, str) else line
-                               for line in raw_rows]
-        for raw_data in frames:
-            if self.full_size != len(raw_data):
-                logger.warning(f'Frame {self.frame_type} size ({self.full_size}) '\
-                               f'and raw_data ({len(raw_data)}) are different!')
-            table_row: list[int | float] = []
-            row_valid_list: list[bool] = []
-            for row in self.rows:
-                data: tuple = row._parse(raw_data, all_bits=True)
-                row_valid_list.append(data[4])
-                table_row.append(data[2])
-                table_row.extend([bit._value for bit in row._repr_bit_list])
-                row_valid_list.extend([bit.is_valid for bit in row._repr_bit_list])
-            table_rows.append(table_row)
-            valid_mask.append(row_valid_list)
-        return (DataFrame(table_rows, columns=header),
-                DataFrame(valid_mask, columns=header))
+        capture: memoryview | None = None
+        frames: Sequence[Buffer] | Sequence[str]
+        if is_buffer(raw_rows):
+            if self.full_size <= 0 or self._variable_size:
+                raise ValueError(f'Frame {self.frame_type} has no fixed size')
+            capture, frames, tail = split_frames(raw_rows, self.full_size,
+                                                 offset)
+            if tail:
+                logger.warning(f'Skipped incomplete frame at the end of the '\
+                               f'capture ({tail} of {self.full_size} bytes)')
+        else:
+            frames = raw_rows  # type: ignore
+        if engine == 'numpy':
+            from bytes_parser import vectorized
+            if capture is None:
+                frames = [frame_data(line) for line in frames]
+            start: float = perf_counter()
+            parsed = vectorized.parse_columns(
+                self, frames, errors, capture,  # type: ignore
+                None if projection is None else set(projection.columns))
+            if self._profiler is not None:
+                self._profiler.record(self.frame_type, 'numpy',
+                                      perf_counter() - start)
+            if parsed is not None:
+                values, valid = parsed
+                if projection is not None:
+                    selected: list[int] = projection.columns
+                    values, valid = vectorized.filter_columns(
+                        header, [values[column] for column in selected],
+                        [valid[column] for column in selected], where)
+                elif self.aggregator is not None:
+                    self.aggregator.update_columns(values, valid)
+                start = perf_counter()
+                tables = (table_from_columns(header, values, output),
+                          table_from_columns(header, valid, output))
+                if self._profiler is not None:
+                    self._profiler.record(self.frame_type, 'output',
+                                          perf_counter() - start)
+                return tables
+            logger.warning(f'Frame {self.frame_type} can not be parsed with '\
+                           f'numpy engine. Fallback to python engine')
+        if projection is not None:
+            table_rows, valid_mask = projection.parse_frames(frames, errors,
+                                                             where)
+        elif self._profiler is None:
+            # values only, no RowResult objects per row
+            table_rows, valid_mask = self._compile_projection(None)\
+                .parse_frames(frames, errors)
+            if self.aggregator is not None:
+                self.aggregator.update_columns(list(zip(*table_rows)),
+                                               list(zip(*valid_mask)))
+        else:
+            for raw_data in frames:
+                result: FrameResult = self.parse_result(raw_data, errors,
+                                                        all_bits=True)
+                table_rows.append(result.values)
+                valid_mask.append(result.valid)
+        start = perf_counter()
+        tables = (table_from_rows(header, table_rows, output),
+                  table_from_rows(header, valid_mask, output))
+        if self._profiler is not None:
+            self._profiler.record(self.frame_type, 'output',
+                                  perf_counter() - start)
+        return tables
+
+    def _compile_projection(self, columns: Sequence[str] | None
+                            ) -> Projection:
+        key: tuple[str, ...] | None = None if columns is None \
+                                      else tuple(columns)
+        projection: Projection | None = self._projections.get(key, None)
+        if projection is None:
+            projection = Projection(self, columns)
+            self._projections[key] = projection
+        return projection
+
+    def parse_table_parallel(self, capture: bytes | Sequence[bytes],
+                             workers: int | None = None,
+                             engine: Literal['python', 'numpy'] = 'python',
+                             output: Output = 'dataframe',
+                             errors: ErrorCounter | None = None
+                             ) -> tuple[Any, Any]:
+        from bytes_parser import parallel
+        return parallel.parse_table(self, capture, workers, engine, output,
+                                    errors)
+
+    def export(self, source: "Source | Buffer | Iterable[Sequence[Buffer]]",
+               path: str | Path, file_format: "Format | None" = None,
+               chunk_size: int = 10000,
+               engine: Literal['python', 'numpy'] = 'python') -> int:
+        from bytes_parser import export
+        return export.export(self, source, path, file_format, chunk_size,
+                             engine)
+
+    def iter_parse(self, source: Source, chunk_size: int = 0,
+                   engine: Literal['python', 'numpy'] = 'python',
+                   output: Output = 'dataframe') -> Iterator[Any]:
+        if chunk_size <= 0:
+            for frames in iter_frames(source, self.full_size):
+                yield self.parse(frames[0], output)
+        else:
+            for frames in iter_frames(source, self.full_size, chunk_size):
+                yield self.parse_table(frames, engine, output)
+
+    async def aparse(self, reader: asyncio.StreamReader, chunk_size: int = 0,
+                     engine: Literal['python', 'numpy'] = 'python',
+                     output: Output = 'dataframe', timeout: float | None = None,
+                     executor: 'Executor | None' = None,
+                     offload_size: int = 64) -> AsyncIterator[Any]:
+        # frames are read only when the consumer asks for the next item,
+        # so a slow consumer leaves data in the StreamReader buffer
+        loop = asyncio.get_running_loop()
+        async for frames in aiter_frames(reader, self.full_size,
+                                         chunk_size, timeout):
+            if chunk_size <= 0:
+                yield self.parse(frames[0], output)
+            elif len(frames) < offload_size:
+                yield self.parse_table(frames, engine, output)
+            else:
+                yield await loop.run_in_executor(
+                    executor, partial(self.parse_table, frames, engine, output))
 
     def clear_errors(self) -> None:
+        self.errors.clear()
+
+    def cache_info(self) -> dict[str, CacheInfo]:
+        return {row.label: row._cache.info() for row in self.rows
+                if row._cache is not None}
+
+    def clear_cache(self) -> None:
         for row in self.rows:
-            row.clear_errors()
+            if row._cache is not None:
+                row._cache.clear()
+
+    def get_errors(self) -> dict[str, int]:
+        return dict(zip(self._get_table_header(), self.errors.counts))
 
     def __repr__(self) -> str:
         table_rows: list[tuple[str, int, int]] = []
         for row in self.rows:
             table_rows.append((row.label, row.size, row._offset))
+        from pandas import DataFrame
         df = DataFrame(table_rows, columns=['Label', 'Size', 'Offset'])
         return df.to_string() + f'\nFull size: {self.full_size}'
 
-    def from_frames(self, *frames: "Frame"):
-        raw_data: bytes = b''
+    def _compile_assembly(self, sources: Sequence["Frame"]
+                          ) -> AssemblyPlan | None:
+        plan: AssemblyPlan | None = self._assembly_plans.get(tuple(sources))
+        if plan is not None:
+            return plan
+        plan = AssemblyPlan(self.full_size, len(sources))
         for row in self.rows:
-            frame_row: Row | None = None
-            for frame in frames:
-                frame_row = frame.rows_dict.get(row.label, None)
-                if frame_row:
+            for index, frame in enumerate(sources):
+                source_row: Row | None = frame.rows_dict.get(row.label, None)
+                if source_row:
                     break
-            if not frame_row:
-                labels: list[str] = [frame.frame_type for frame in frames]
+            else:
+                labels: list[str] = [frame.frame_type for frame in sources]
                 logger.error(f'Row {row.label} not found in {labels}')
                 return None
-            raw_data += frame_row.raw_val
-        if len(raw_data) != self.full_size:
+            if source_row.size != row.size:
+                logger.error(f'Failed to assemble frame. Row {row.label} '\
+                             f'size {source_row.size} != {row.size}')
+                return None
+            plan.add(index, source_row, row._offset)
+        self._assembly_plans[tuple(sources)] = plan
+        return plan
+
+    def from_frames(self, *frames: "Frame | FrameResult",
+                    output: Output = 'dataframe'):
+        results: list[FrameResult] = last_results(frames)
+        plan: AssemblyPlan | None = self._compile_assembly(
+            [result.frame for result in results])
+        if plan is None:
+            return None
+        raw_data: bytes | None = plan.assemble([result.raw_data
+                                                for result in results])
+        if raw_data is None:
             logger.error('Failed to assemble frame')
             return None
-        return self.parse(raw_data)
+        return self.parse(raw_data, output)
+
+    def from_frames_table(self, frames: Sequence["Frame"],
+                          raw_rows: Sequence[Sequence[bytes]],
+                          engine: Literal['python', 'numpy'] = 'python',
+                          output: Output = 'dataframe') -> tuple[Any, Any] | None:
+        plan: AssemblyPlan | None = self._compile_assembly(frames)
+        if plan is None:
+            return None
+        return assemble_table(self, plan, raw_rows, engine, output)
+
+
+def assemble_table(frame: Frame, plan: AssemblyPlan,
+                   raw_rows: Sequence[Sequence[bytes]],
+                   engine: Literal['python', 'numpy'],
+                   output: Output) -> tuple[Any, Any] | None:
+    buffer: bytes | None = plan.assemble_many(raw_rows)
+    if buffer is None:
+        logger.error('Failed to assemble frames. Incorrect source size')
+        return None
+    size: int = frame.full_size
+    return frame.parse_table([buffer[i: i + size]
+                              for i in range(0, len(buffer), size)],
+                             engine, output)
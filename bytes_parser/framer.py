@@ -0,0 +1,178 @@
+from collections.abc import Callable
+from typing import Any, Literal, NamedTuple
+
+from loguru import logger
+
+from bytes_parser.checksum import get_algorithm
+from bytes_parser.frame import Frame
+from bytes_parser.output import Output
+
+Checksum = Callable[[bytes], int]
+
+
+class FramingResult(NamedTuple):
+    frames: list[bytes]
+    skipped: int
+    checksum_errors: int
+    tail: bytes
+
+
+class Framer:
+    # frame size is either frame.full_size or length row value + length_adjust;
+    # checksum is stored in the last checksum_size bytes of the frame,
+    # a name selects a built-in algorithm ('crc16_ccitt', 'xor8', ...);
+    # max_size is limited to the largest size the length row can encode
+    def __init__(self, frame: Frame, sync: bytes | str,
+                 length_row: str | None = None, length_adjust: int = 0,
+                 checksum: Checksum | str | None = None,
+                 checksum_size: int = 0,
+                 checksum_start: int = 0, max_size: int = 65536) -> None:
+        if isinstance(sync, str):
+            sync = bytes.fromhex(sync)
+        if not sync:
+            raise ValueError('Framer sync word is empty')
+        if isinstance(checksum, str):
+            checksum = get_algorithm(checksum)
+        self.frame: Frame = frame
+        self.sync: bytes = sync
+        self.length_adjust: int = length_adjust
+        self.checksum: Checksum | None = checksum
+        self.checksum_size: int = checksum_size
+        self.checksum_start: int = checksum_start
+        self._checksum_order: Literal['big', 'little'] = frame._byte_order
+        self._length: tuple[int, int, Literal['big', 'little'], bool] | None = None
+        if length_row is not None:
+            row = frame.rows_dict.get(length_row, None)
+            if row is None or row.size <= 0:
+                raise ValueError(f'Incorrect length row {length_row} for '\
+                                 f'frame {frame.frame_type}')
+            self._length = (row._offset, row.size, row.byte_order, row.signed)
+            self.min_size: int = row._offset + row.size
+            bits: int = row.size * 8 - row.signed
+            largest: int = (1 << bits) - 1 + length_adjust
+        elif frame.full_size > 0:
+            self.min_size = frame.full_size
+            largest = frame.full_size
+        else:
+            raise ValueError(f'Frame {frame.frame_type} has no fixed size '\
+                             f'and length row is not set')
+        self.min_size = max(self.min_size, len(sync),
+                            checksum_start + checksum_size)
+        self.max_size: int = min(max_size, largest)
+        if checksum is not None and checksum_size <= 0:
+            raise ValueError('Framer checksum_size is not set')
+        self._buffer: bytes = b''
+        self.skipped: int = 0
+        self.checksum_errors: int = 0
+        self.frames_count: int = 0
+
+    def _frame_size(self, data: bytes, start: int) -> int:
+        if self._length is None:
+            return self.frame.full_size
+        offset, size, byte_order, signed = self._length
+        return int.from_bytes(data[start + offset: start + offset + size],
+                              byte_order, signed=signed) + self.length_adjust
+
+    def _check(self, frame: bytes) -> bool:
+        expected: int = int.from_bytes(frame[-self.checksum_size:],
+                                       self._checksum_order)
+        return self.checksum(frame[self.checksum_start:  # type: ignore
+                                   -self.checksum_size]) == expected
+
+    def split(self, data: bytes | bytearray | str,
+              final: bool = False) -> FramingResult:
+        # a candidate cut off by the end of data is kept as tail; with a
+        # checksum the search goes on after it and a later valid frame
+        # rejects it (false sync word with a bogus length).
+        # final: data is the end of the stream, a candidate cut off by the
+        # end is rejected like a bad length and the search restarts one byte
+        # after its sync word
+        if isinstance(data, str):
+            data = bytes.fromhex(data)
+        frames: list[bytes] = []
+        skipped: int = 0
+        checksum_errors: int = 0
+        pos: int = 0
+        end: int = len(data)
+        # first incomplete candidate and counters before it
+        pending: int = -1
+        pending_counts: tuple[int, int] = (0, 0)
+        while True:
+            start: int = data.find(self.sync, pos)
+            if start < 0:
+                break
+            skipped += start - pos
+            size: int = 0
+            if start + self.min_size <= end:
+                size = self._frame_size(data, start)
+                if size < self.min_size or size > self.max_size:
+                    pos = start + 1
+                    skipped += 1
+                    continue
+            if not size or start + size > end:
+                pos = start + 1
+                if final:
+                    skipped += 1
+                    continue
+                if pending < 0:
+                    pending = start
+                    pending_counts = (skipped, checksum_errors)
+                if self.checksum is None:
+                    break
+                continue
+            frame = bytes(data[start: start + size])
+            if self.checksum is not None and not self._check(frame):
+                checksum_errors += 1
+                pos = start + 1
+                skipped += 1
+                continue
+            if pending >= 0:
+                # bytes from the rejected candidate up to this frame
+                skipped = pending_counts[0] + start - pending
+                pending = -1
+            frames.append(frame)
+            pos = start + size
+        if pending >= 0:
+            skipped, checksum_errors = pending_counts
+            return FramingResult(frames, skipped, checksum_errors,
+                                 bytes(data[pending:]))
+        # keep bytes that can be the beginning of the next sync word
+        keep: int = end if final else max(pos, end - len(self.sync) + 1)
+        skipped += keep - pos
+        return FramingResult(frames, skipped, checksum_errors,
+                             bytes(data[keep:]))
+
+    def feed(self, data: bytes | bytearray | str) -> list[bytes]:
+        if isinstance(data, str):
+            data = bytes.fromhex(data)
+        result: FramingResult = self.split(self._buffer + data)
+        self._buffer = result.tail
+        self.skipped += result.skipped
+        self.checksum_errors += result.checksum_errors
+        self.frames_count += len(result.frames)
+        return result.frames
+
+    def flush(self) -> list[bytes]:
+        # end of stream: the kept tail is searched again from the byte after
+        # an incomplete candidate (false sync word with a bogus length), only
+        # bytes outside of any frame are dropped
+        result: FramingResult = self.split(self._buffer, final=True)
+        self._buffer = b''
+        if result.skipped:
+            logger.warning(f'Skipped {result.skipped} bytes at the end of the '\
+                           f'stream')
+        self.skipped += result.skipped
+        self.checksum_errors += result.checksum_errors
+        self.frames_count += len(result.frames)
+        return result.frames
+
+    def reset(self) -> None:
+        self._buffer = b''
+        self.skipped = 0
+        self.checksum_errors = 0
+        self.frames_count = 0
+
+    def parse_table(self, data: bytes | bytearray | str,
+                    engine: Literal['python', 'numpy'] = 'python',
+                    output: Output = 'dataframe') -> tuple[Any, Any]:
+        return self.frame.parse_table(self.feed(data), engine, output)
@@ -0,0 +1,114 @@
+import importlib
+import json
+import tomllib
+from functools import cache
+from pathlib import Path
+from typing import Any
+
+from bytes_parser.array_row import RowArray
+from bytes_parser.bitfields import BitField, BitFlag
+from bytes_parser.checksum import ChecksumValidator
+from bytes_parser.frame import Frame, Location
+from bytes_parser.row import Row
+from bytes_parser.subframe import SubFrame
+
+_HANDLERS: tuple[str, ...] = ('parser', 'validator', 'representer')
+
+
+@cache
+def resolve(reference: str) -> Any:
+    # 'package.module:name' -> object
+    module_name, _, name = reference.partition(':')
+    if not name:
+        raise ValueError(f'Incorrect handler reference {reference!r}, '\
+                         f'expected "module:name"')
+    obj: Any = importlib.import_module(module_name)
+    for attr in name.split('.'):
+        obj = getattr(obj, attr)
+    return obj
+
+
+def _handlers(spec: dict) -> dict:
+    spec = dict(spec)
+    for key in _HANDLERS:
+        if isinstance(spec.get(key, None), str):
+            spec[key] = resolve(spec[key])
+    return spec
+
+
+def build_bit(spec: dict) -> BitField | BitFlag:
+    if 'ok_condition' in spec:
+        return BitFlag(**spec)
+    return BitField(**_handlers(spec))
+
+
+def build_rows(specs: list[dict]) -> list[Row]:
+    rows: list[Row] = []
+    for spec in specs:
+        if 'array' in spec:
+            spec = dict(spec)
+            template: list[dict] | dict = spec.pop('array')
+            if isinstance(template, dict):
+                template = [template]
+            rows.append(RowArray(template=build_rows(template), **spec))
+            continue
+        if 'subframe' in spec:
+            spec = dict(spec)
+            sub_rows: list[Row] = build_rows(spec.pop('subframe'))
+            repeat: int | None = spec.pop('repeat', None)
+            prefix: str = spec.pop('prefix', '')
+            postfix: str = spec.pop('postfix', '')
+            for i in range(repeat or 1):
+                rows.extend(SubFrame(sub_rows, prefix.format(i=i),
+                                     postfix=postfix.format(i=i), **spec))
+            continue
+        spec = _handlers(spec)
+        if 'checksum' in spec:
+            checksum: str | dict = spec.pop('checksum')
+            if isinstance(checksum, str):
+                checksum = {'algorithm': checksum}
+            spec['validator'] = ChecksumValidator(**checksum)
+        if 'args' in spec:
+            spec['args'] = tuple(spec['args'])
+        spec['bit_fields'] = [build_bit(bit)
+                              for bit in spec.get('bit_fields', [])]
+        try:
+            rows.append(Row(**spec))
+        except TypeError as err:
+            raise ValueError(f'Incorrect row definition {spec}: {err}') \
+                from err
+    return rows
+
+
+def build_frame(spec: dict, location: Location | None = None) -> Frame:
+    spec = dict(spec)
+    frame_type: str = spec.pop('frame_type', None) or spec.pop('type')
+    rows: list[Row] = build_rows(spec.pop('rows'))
+    return Frame(frame_type, rows, location=location, **spec)
+
+
+def read_definitions(path: str | Path) -> list[dict]:
+    path = Path(path)
+    with open(path, 'rb') as file:
+        if path.suffix.lower() == '.toml':
+            data: Any = tomllib.load(file)
+        elif path.suffix.lower() == '.json':
+            data = json.load(file)
+        else:
+            raise ValueError(f'Unknown frame definition format: {path}')
+    if isinstance(data, dict):
+        data = data.get('frames', [])
+    return data
+
+
+def load_frames(path: str | Path) -> dict[str, Frame]:
+    path = Path(path)
+    location = Location(path.stem, path)
+    frames: dict[str, Frame] = {}
+    for spec in read_definitions(path):
+        frame: Frame = build_frame(spec, location)
+        if frame.frame_type in frames:
+            raise ValueError(f'Duplicated frame type {frame.frame_type} '\
+                             f'in {path}')
+        frames[frame.frame_type] = frame
+    return frames
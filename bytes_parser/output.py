@@ -0,0 +1,83 @@
+import re
+from collections import namedtuple
+from collections.abc import Sequence
+from functools import lru_cache
+from typing import Any, Literal, NamedTuple
+
+Output = Literal['dataframe', 'tuple', 'dict', 'record', 'columns']
+COLUMNS: tuple[str, ...] = ('Name', 'Value', 'Numeric', 'Hex', 'IsOK', 'ErrCnt')
+VALUE_COLUMNS: tuple[str, ...] = ('Name', 'Numeric', 'IsOK', 'ErrCnt')
+
+
+class RowRecord(NamedTuple):
+    name: str
+    value: str
+    numeric: int | float
+    hex: str
+    is_ok: bool
+    err_cnt: int
+
+
+class RowValueRecord(NamedTuple):
+    name: str
+    numeric: int | float
+    is_ok: bool
+    err_cnt: int
+
+
+@lru_cache(maxsize=256)
+def table_record(header: tuple[str, ...]) -> type:
+    fields: list[str] = [re.sub(r'\W+', '_', label).strip('_') or 'field'
+                         for label in header]
+    return namedtuple('TableRecord', fields, rename=True)
+
+
+def rows_output(table_rows: list[tuple], output: Output,
+                header: str = 'Name', with_repr: bool = True) -> Any:
+    columns: tuple[str, ...] = COLUMNS if with_repr else VALUE_COLUMNS
+    if output == 'tuple':
+        return table_rows
+    if output == 'record':
+        record: type = RowRecord if with_repr else RowValueRecord
+        return [record(*row) for row in table_rows]
+    if output == 'dict':
+        return [dict(zip(columns, row)) for row in table_rows]
+    if output == 'columns':
+        return dict(zip(columns, map(list, zip(*table_rows))))\
+               or {column: [] for column in columns}
+    if output == 'dataframe':
+        from pandas import DataFrame
+        return DataFrame(table_rows, columns=[header, *columns[1:]])
+    raise ValueError(f'Incorrect output type: {output}')
+
+
+def table_from_rows(header: list[str], table_rows: list[Sequence],
+                    output: Output) -> Any:
+    if output == 'tuple':
+        return [tuple(row) for row in table_rows]
+    if output == 'record':
+        record: type = table_record(tuple(header))
+        return [record(*row) for row in table_rows]
+    if output == 'dict':
+        return [dict(zip(header, row)) for row in table_rows]
+    if output == 'columns':
+        columns: list[list] = [list(column) for column in zip(*table_rows)]
+        return dict(zip(header, columns or [[] for _ in header]))
+    if output == 'dataframe':
+        from pandas import DataFrame
+        return DataFrame(table_rows, columns=header)
+    raise ValueError(f'Incorrect output type: {output}')
+
+
+def table_from_columns(header: list[str], columns: list[Sequence],
+                       output: Output) -> Any:
+    if output == 'dataframe':
+        from pandas import DataFrame
+        table = DataFrame(dict(enumerate(columns)))
+        table.columns = header
+        return table
+    columns = [column if isinstance(column, list) else column.tolist()  # type: ignore
+               for column in columns]
+    if output == 'columns':
+        return dict(zip(header, columns))
+    return table_from_rows(header, list(zip(*columns)), output)
@@ -0,0 +1,94 @@
+import math
+import os
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import TYPE_CHECKING, Any, Literal
+
+from loguru import logger
+
+from bytes_parser.aggregate import Aggregator
+from bytes_parser.output import Output, table_from_rows
+from bytes_parser.result import ErrorCounter
+
+if TYPE_CHECKING:
+    from bytes_parser.frame import Frame
+
+
+_worker: dict[str, Any] = {}
+
+
+def _init_worker(frame: "Frame", shm_name: str) -> None:
+    _worker['frame'] = frame
+    _worker['shm'] = shared_memory.SharedMemory(name=shm_name)
+
+
+def _parse_range(start: int, stop: int,
+                 engine: Literal['python', 'numpy'],
+                 output: Output) -> tuple[Any, Any, list[int],
+                                          Aggregator | None]:
+    frame: Frame = _worker['frame']
+    if frame.aggregator is not None:
+        frame.aggregator.reset()
+    size: int = frame.full_size
+    errors = ErrorCounter(len(frame.errors))
+    # frames are parsed in place in the shared memory
+    block: memoryview = _worker['shm'].buf[start * size: stop * size]
+    try:
+        table, valid_mask = frame.parse_table(block, engine, output, errors)
+    finally:
+        block.release()
+    return table, valid_mask, errors.counts, frame.aggregator
+
+
+def parse_table(frame: "Frame", capture: bytes | Sequence[bytes],
+                workers: int | None = None,
+                engine: Literal['python', 'numpy'] = 'python',
+                output: Output = 'dataframe',
+                errors: ErrorCounter | None = None) -> tuple[Any, Any]:
+    if frame.full_size <= 0 or frame._variable_size:
+        raise ValueError(f'Frame {frame.frame_type} has no fixed size')
+    if errors is None:
+        errors = frame.errors
+    if not isinstance(capture, (bytes, bytearray, memoryview)):
+        capture = b''.join(capture)
+    count, tail = divmod(len(capture), frame.full_size)
+    if tail:
+        logger.warning(f'Skipped incomplete frame at the end of the capture '\
+                       f'({tail} of {frame.full_size} bytes)')
+    workers = workers or os.cpu_count() or 1
+    step: int = max(math.ceil(count / (workers * 4)), 1)
+    worker_output: Output = ('tuple', 'dataframe')[output == 'dataframe']
+    shm = shared_memory.SharedMemory(create=True,
+                                     size=max(count * frame.full_size, 1))
+    try:
+        shm.buf[:count * frame.full_size] = capture[:count * frame.full_size]
+        with ProcessPoolExecutor(workers, initializer=_init_worker,
+                                 initargs=(frame, shm.name)) as executor:
+            futures = [executor.submit(_parse_range, start,
+                                       min(start + step, count),
+                                       engine, worker_output)
+                       for start in range(0, count, step)]
+            parts: list[tuple[Any, Any, list[int], Aggregator | None]] = \
+                [future.result() for future in futures]
+    finally:
+        shm.close()
+        shm.unlink()
+    for _, _, counts, aggregator in parts:
+        partial = ErrorCounter(len(counts))
+        partial.counts = counts
+        errors.merge(partial)
+        if aggregator is not None and frame.aggregator is not None:
+            frame.aggregator.merge(aggregator)
+    header: list[str] = frame._get_table_header()
+    if not parts:
+        return (table_from_rows(header, [], output),
+                table_from_rows(header, [], output))
+    if output == 'dataframe':
+        from pandas import concat
+        return (concat([part[0] for part in parts], ignore_index=True),
+                concat([part[1] for part in parts], ignore_index=True))
+    return (table_from_rows(header, [row for part in parts for row in part[0]],
+                            output),
+            table_from_rows(header, [row for part in parts for row in part[1]],
+                            output))
@@ -0,0 +1,44 @@
+import threading
+from collections.abc import Callable
+from typing import NamedTuple
+
+Hook = Callable[[str, str, float, bool], None]
+
+
+class StageStats(NamedTuple):
+    calls: int
+    seconds: float
+    failures: int
+
+    @property
+    def failure_rate(self) -> float:
+        return self.failures / self.calls if self.calls else 0.0
+
+
+class Profiler:
+    # stages: parser, validator, representer, bits, cache, struct, numpy, output
+    def __init__(self, hook: Hook | None = None) -> None:
+        self.hook: Hook | None = hook
+        self._lock = threading.Lock()
+        self._stats: dict[str, dict[str, list]] = {}
+
+    def record(self, label: str, stage: str, seconds: float,
+               failed: bool = False) -> None:
+        with self._lock:
+            stats: list = self._stats.setdefault(label, {})\
+                                     .setdefault(stage, [0, 0.0, 0])
+            stats[0] += 1
+            stats[1] += seconds
+            stats[2] += failed
+        if self.hook:
+            self.hook(label, stage, seconds, failed)
+
+    def snapshot(self) -> dict[str, dict[str, StageStats]]:
+        with self._lock:
+            return {label: {stage: StageStats(*stats)
+                            for stage, stats in stages.items()}
+                    for label, stages in self._stats.items()}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
@@ -0,0 +1,219 @@
+from collections.abc import Callable, Iterable, Sequence
+from typing import TYPE_CHECKING, Any, Literal
+
+from loguru import logger
+
+from bytes_parser.array_row import RowArray
+from bytes_parser.bitfields import BitField, BitFlag
+from bytes_parser.buffer import Buffer, frame_data
+from bytes_parser.cache import NULL_ERRORS
+from bytes_parser.default_handlers import parse_bit_field
+from bytes_parser.result import ErrorCounter, FrameResult, RowResult
+from bytes_parser.struct_plan import StructPlan
+
+if TYPE_CHECKING:
+    from bytes_parser.frame import Frame
+    from bytes_parser.row import Row
+
+# predicate gets {column: value} of the selected columns, 'failures' keeps
+# frames where any selected column is not valid
+Where = Callable[[dict[str, Any]], Any] | Literal['failures']
+
+_FLAG, _FIELD, _CUSTOM_FIELD = 0, 1, 2
+
+
+class LazyFrameResult(FrameResult):
+    # parent given to handlers of rows decoded outside of parse_result:
+    # rows before limit are decoded on first access (parse() gives handlers
+    # the rows decoded so far), their errors are counted by their own columns
+    def __init__(self, frame: "Frame", raw_data: bytes | memoryview,
+                 limit: int) -> None:
+        super().__init__(frame, raw_data)
+        self.limit: int = limit
+
+    def _decode(self, index: int) -> None:
+        rows: list[Row] = self.frame.rows
+        while len(self.rows) <= min(index, self.limit - 1):
+            self.rows.append(rows[len(self.rows)]._parse(
+                self.raw_data, NULL_ERRORS, True, self))
+
+    def __getitem__(self, key: str | int) -> Any:
+        self._decode(key if isinstance(key, int)
+                     else self.frame._rows_index[key])
+        return super().__getitem__(key)
+
+    def get_row(self, label: str) -> RowResult | None:
+        index: int | None = self.frame._rows_index.get(label, None)
+        if index is not None:
+            self._decode(index)
+        return super().get_row(label)
+
+
+def check_where(where: Where | None) -> None:
+    if isinstance(where, str) and where != 'failures':
+        raise ValueError(f'Incorrect where filter: {where}')
+
+
+class Projection:
+    # selected table columns compiled into one struct call over the selected
+    # rows and per bit shift/mask steps; other rows and bits are not decoded
+    def __init__(self, frame: "Frame",
+                 columns: Sequence[str] | None = None) -> None:
+        header: list[str] = frame._get_table_header()
+        lookup: dict[str, int] = {}
+        for column, name in enumerate(header):
+            # bit columns can be selected without indentation
+            lookup.setdefault(name.strip(), column)
+        lookup.update({name: column for column, name in enumerate(header)})
+        owners: list[tuple[int, int]] = []
+        for i, row in enumerate(frame.rows):
+            if row._width != 1:
+                owners.extend((i, j) for j in range(row._width))
+                continue
+            owners.append((i, -1))
+            owners.extend((i, j) for j in range(len(row.bit_fields)))
+        self.names: list[str] = list(header if columns is None else columns)
+        if not self.names:
+            raise ValueError(f'No columns selected in frame {frame.frame_type}')
+        self.columns: list[int] = []
+        selected: dict[int, list[tuple[int, int]]] = {}
+        for slot, name in enumerate(self.names):
+            column: int | None = lookup.get(name, None)
+            if column is None:
+                raise ValueError(f'Unknown column {name!r} in frame '\
+                                 f'{frame.frame_type}')
+            if column in self.columns:
+                raise ValueError(f'Duplicated column {name!r} in frame '\
+                                 f'{frame.frame_type}')
+            self.columns.append(column)
+            row_index, part = owners[column]
+            selected.setdefault(row_index, []).append((part, slot))
+        self.frame: Frame = frame
+        self.frame_type: str = frame.frame_type
+        self.full_size: int = frame.full_size
+        self._variable_size: bool = frame._variable_size
+        self._struct_plan: StructPlan = StructPlan(frame.rows, selected)
+        self._steps: list[tuple] = []
+        for row_index in sorted(selected):
+            row: Row = frame.rows[row_index]
+            parts: list[tuple[int, int]] = selected[row_index]
+            value_slot: int = next((slot for part, slot in parts if part < 0),
+                                   -1)
+            if isinstance(row, RowArray):
+                elements: list[tuple[int, int]] = [(slot, part) for part, slot
+                                                   in parts if part >= 0]
+                self._steps.append((row, row_index, -1, value_slot, elements,
+                                    True))
+                continue
+            bits: list[tuple] = [_bit_step(row, part, slot)
+                                 for part, slot in sorted(parts) if part >= 0]
+            self._steps.append((row, row_index,
+                                self._struct_plan.index[row_index],
+                                value_slot, bits, False))
+
+    def parse(self, raw_data: bytes | memoryview, errors: ErrorCounter
+              ) -> tuple[list, list[bool]]:
+        if self.full_size != len(raw_data) and \
+           (len(raw_data) < self.full_size or not self._variable_size):
+            logger.warning(f'Frame {self.frame_type} size ({self.full_size}) '\
+                           f'and raw_data ({len(raw_data)}) are different!')
+        values: list = [None] * len(self.names)
+        valid: list[bool] = [True] * len(self.names)
+        unpacked: tuple | None = self._struct_plan.unpack(raw_data)
+        for row, row_index, index, slot, bits, is_array in self._steps:
+            if is_array:
+                _array_values(row, raw_data, errors, slot, bits, values, valid)
+                continue
+            if slot >= 0:
+                if unpacked is not None and index >= 0:
+                    value: Any = unpacked[index]
+                    is_valid: bool = row.min_value <= value <= row.max_value
+                else:
+                    value, is_valid = _row_value(row, row_index, raw_data,
+                                                 self.frame)
+                if not is_valid:
+                    errors.add(row._column)
+                values[slot] = value
+                valid[slot] = is_valid
+            if not bits:
+                continue
+            val: int = int.from_bytes(
+                raw_data[row._offset: row._offset + row.size], row.byte_order)
+            for bit_slot, column, kind, pos, mask, bit, low, high in bits:
+                if kind == _CUSTOM_FIELD:
+                    result = parse_bit_field(bit, val, row.byte_order, errors,
+                                             column, mask)
+                    value, is_valid = result._value, result.is_valid
+                else:
+                    value = (val >> pos) & mask
+                    if kind == _FLAG:
+                        is_valid = value == low
+                    else:
+                        is_valid = low < value < high
+                    if not is_valid:
+                        errors.add(column)
+                values[bit_slot] = value
+                valid[bit_slot] = is_valid
+        return values, valid
+
+    def parse_frames(self, frames: Iterable[Buffer | str], errors: ErrorCounter,
+                     where: Where | None = None
+                     ) -> tuple[list[list], list[list[bool]]]:
+        table_rows: list[list] = []
+        valid_mask: list[list[bool]] = []
+        for raw_data in frames:
+            values, valid = self.parse(frame_data(raw_data), errors)
+            if where == 'failures':
+                if all(valid):
+                    continue
+            elif where is not None and \
+                    not where(dict(zip(self.names, values))):  # type: ignore
+                continue
+            table_rows.append(values)
+            valid_mask.append(valid)
+        return table_rows, valid_mask
+
+
+def _bit_step(row: "Row", index: int, slot: int) -> tuple:
+    bit: BitField | BitFlag = row.bit_fields[index]
+    column: int = row._bit_plan.column + index
+    if isinstance(bit, BitFlag):
+        return (slot, column, _FLAG, bit.pos, 1, bit, int(bit.ok_condition), 0)
+    kind: int = _CUSTOM_FIELD if bit.parser or bit.validator else _FIELD
+    return (slot, column, kind, bit.pos, (1 << bit.length) - 1, bit,
+            bit.min_value, bit.max_value)
+
+
+def _row_value(row: "Row", row_index: int, raw_data: bytes | memoryview,
+               frame: "Frame") -> tuple[int | float, bool]:
+    # custom handlers, odd sizes and short frames; validators such as
+    # ChecksumValidator read the whole frame through the parent result
+    if row.size > 0:
+        raw_val: bytes | memoryview = raw_data[row._offset:
+                                               row._offset + row.size]
+    else:
+        raw_val = raw_data[row._offset:]
+    if row._copy_raw and not isinstance(raw_val, bytes):
+        raw_val = bytes(raw_val)
+    if row._cache is not None:
+        cached: RowResult = row._parse_cached(raw_val, None, NULL_ERRORS,
+                                              False, None)
+        return cached._parsed_val, cached._is_valid
+    result = RowResult(row, raw_val,
+                       LazyFrameResult(frame, raw_data, row_index))
+    result._parsed_val = row.parser(result, *row.args, **row.kwargs)
+    return result._parsed_val, row.validator(result, *row.args, **row.kwargs)
+
+
+def _array_values(row: RowArray, raw_data: bytes | memoryview,
+                  errors: ErrorCounter, slot: int,
+                  elements: list[tuple[int, int]], values: list,
+                  valid: list[bool]) -> None:
+    result: RowResult = row._parse(raw_data, errors)
+    if slot >= 0:
+        values[slot] = result._parsed_val
+        valid[slot] = result._is_valid
+    for element_slot, index in elements:
+        values[element_slot] = result._parsed_val[index]  # type: ignore
+        if result._elements_valid is not None:
+            valid[element_slot] = result._elements_valid[index]
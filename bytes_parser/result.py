@@ -0,0 +1,241 @@
+import threading
+from collections.abc import Iterable
+from operator import attrgetter
+from time import perf_counter
+from typing import TYPE_CHECKING, Any
+
+from bytes_parser.bitfields import BitField, BitFlag
+
+if TYPE_CHECKING:
+    from bytes_parser.frame import Frame
+    from bytes_parser.profiler import Profiler
+    from bytes_parser.row import Row
+
+
+class ErrorCounter:
+    # error counters indexed by Frame table header column
+    def __init__(self, size: int) -> None:
+        self._lock = threading.Lock()
+        self.counts: list[int] = [0] * size
+
+    def __getstate__(self) -> dict:
+        return {'counts': self.counts}
+
+    def __setstate__(self, state: dict) -> None:
+        self._lock = threading.Lock()
+        self.counts = state['counts']
+
+    def add(self, column: int, count: int = 1) -> int:
+        with self._lock:
+            self.counts[column] += count
+            return self.counts[column]
+
+    def __getitem__(self, column: int) -> int:
+        return self.counts[column]
+
+    def __len__(self) -> int:
+        return len(self.counts)
+
+    def clear(self, columns: Iterable[int] | None = None) -> None:
+        with self._lock:
+            if columns is None:
+                self.counts = [0] * len(self.counts)
+                return
+            for column in columns:
+                self.counts[column] = 0
+
+    def merge(self, other: "ErrorCounter") -> "ErrorCounter":
+        if len(other) != len(self):
+            raise ValueError(f'Incorrect ErrorCounter size {len(other)} != '\
+                             f'{len(self)}')
+        with self._lock:
+            self.counts = [a + b for a, b in zip(self.counts, other.counts)]
+        return self
+
+
+def forward_attributes(cls: type, target: str, names: Iterable[str]) -> None:
+    # read only properties to the definition attributes; __getattr__ would
+    # slow down every attribute access on the result classes
+    for name in names:
+        if not hasattr(cls, name):
+            setattr(cls, name, property(attrgetter(f'{target}.{name}')))
+
+
+class BitResult:
+    __slots__ = ('_cached', '_raw', '_repr_cache', '_value', 'bit', 'errors',
+                 'is_valid')
+
+    def __init__(self, bit: "BitField | BitFlag") -> None:
+        self.bit: BitField | BitFlag = bit
+        # Row cache entry this result is copied from
+        self._cached: BitResult | None = None
+        self._value: int | float = 0
+        self._raw: bytes = b''
+        self._repr_cache: str | None = None
+        self.is_valid: bool = True
+        self.errors: int = 0
+
+    @property
+    def _repr(self) -> str:
+        # formatted on first access only
+        if self._repr_cache is None:
+            if isinstance(self.bit, BitFlag):
+                self._repr_cache = f'{self._value}'
+            elif self.bit.representer:
+                self._repr_cache = self.bit.representer(self)
+            else:
+                str_format: str = self.bit.str_format
+                if str_format == 'd' and isinstance(self._value, float):
+                    str_format = 'f'
+                self._repr_cache = f'{self._value:{str_format}}'
+            if self._cached is not None:
+                self._cached._repr_cache = self._repr_cache
+        return self._repr_cache
+
+    @_repr.setter
+    def _repr(self, value: str) -> None:
+        self._repr_cache = value
+
+    @property
+    def hex(self) -> str:
+        return f'0x{self._raw.hex().upper()}'
+
+    def get_tuple(self) -> tuple[str, str, int | float, str, bool, int]:
+        return (self.bit._repr_label, self._repr, self._value, self.hex,
+                self.is_valid, self.errors)
+
+    def get_values_tuple(self) -> tuple[str, int | float, bool, int]:
+        return (self.bit._repr_label, self._value, self.is_valid, self.errors)
+
+
+forward_attributes(BitResult, 'bit', {*BitField.__slots__, *BitFlag.__slots__,
+                                      '_repr_label'})
+
+
+class RowResult:
+    # passed to parser/validator/representer callbacks instead of Row;
+    # Row attributes are forwarded by forward_attributes
+    __slots__ = ('_cached', '_elements_errors', '_elements_valid', '_errors',
+                 '_expanded', '_is_valid', '_parent_frame', '_parsed_val',
+                 '_profiler', '_repr_bit_list', '_repr_cache', 'raw_val',
+                 'row')
+
+    def __init__(self, row: "Row", raw_val: bytes | memoryview,
+                 parent: "FrameResult | None" = None) -> None:
+        self.row: Row = row
+        self.raw_val: bytes | memoryview = raw_val
+        self._parent_frame: FrameResult | None = parent
+        self._parsed_val: int | float = 0
+        self._is_valid: bool = True
+        self._repr_cache: str | None = None
+        self._repr_bit_list: list[BitResult] = []
+        self._errors: int = 0
+        self._profiler: Profiler | None = None
+        # Row cache entry, gets the representation once it is computed
+        self._cached: RowResult | None = None
+        # RowArray results
+        self._expanded: bool = False
+        self._elements_valid: list[bool] | None = None
+        self._elements_errors: list[int] | None = None
+
+    @property
+    def _repr_data(self) -> str:
+        # representer is called on first access only
+        if self._repr_cache is None:
+            row: Row = self.row
+            if self._profiler is None:
+                self._repr_cache = row.representer(self, *row.args,
+                                                   **row.kwargs)
+            else:
+                start: float = perf_counter()
+                self._repr_cache = row.representer(self, *row.args,
+                                                   **row.kwargs)
+                self._profiler.record(row.label, 'representer',
+                                      perf_counter() - start)
+            if self._cached is not None:
+                self._cached._repr_cache = self._repr_cache
+        return self._repr_cache
+
+    @_repr_data.setter
+    def _repr_data(self, value: str) -> None:
+        self._repr_cache = value
+
+    @property
+    def hex(self) -> str:
+        return f'0x{self.raw_val.hex().upper()}'
+
+    def get_tuple(self) -> tuple[str, str, int | float, str, bool, int]:
+        row: Row = self.row
+        repr_data: str | None = self._repr_cache
+        if repr_data is None:
+            if self._profiler is None and self._cached is None:
+                repr_data = self._repr_cache = row.representer(
+                    self, *row.args, **row.kwargs)
+            else:
+                repr_data = self._repr_data
+        return (row.label, repr_data, self._parsed_val,
+                f'0x{self.raw_val.hex().upper()}', self._is_valid,
+                self._errors)
+
+    def get_values_tuple(self) -> tuple[str, int | float, bool, int]:
+        return (self.row.label, self._parsed_val, self._is_valid, self._errors)
+
+
+class FrameResult:
+    def __init__(self, frame: "Frame", raw_data: bytes | memoryview) -> None:
+        self.frame: Frame = frame
+        self.raw_data: bytes | memoryview = raw_data
+        self.rows: list[RowResult] = []
+
+    @property
+    def frame_type(self) -> str:
+        return self.frame.frame_type
+
+    def __getitem__(self, key: str | int) -> Any:
+        if isinstance(key, int):
+            return self.rows[key]._parsed_val
+        return self.rows[self.frame._rows_index[key]]._parsed_val
+
+    def get_row(self, label: str) -> RowResult | None:
+        index: int | None = self.frame._rows_index.get(label, None)
+        if index is None or index >= len(self.rows):
+            return None
+        return self.rows[index]
+
+    @property
+    def values(self) -> list[int | float]:
+        values: list[int | float] = []
+        for row in self.rows:
+            if row._expanded:
+                values.extend(row._parsed_val)  # type: ignore
+                continue
+            values.append(row._parsed_val)
+            values.extend([bit._value for bit in row._repr_bit_list])
+        return values
+
+    @property
+    def valid(self) -> list[bool]:
+        valid: list[bool] = []
+        for row in self.rows:
+            if row._expanded:
+                valid.extend(row._elements_valid or
+                             [True] * len(row._parsed_val))  # type: ignore
+                continue
+            valid.append(row._is_valid)
+            valid.extend([bit.is_valid for bit in row._repr_bit_list])
+        return valid
+
+    def to_tuples(self, with_repr: bool = True) -> list[tuple]:
+        table_rows: list[tuple] = []
+        append = table_rows.append
+        for row in self.rows:
+            if row._expanded:
+                table_rows.extend(row.row._element_tuples(  # type: ignore
+                    row, with_repr))
+                continue
+            append(row.get_tuple() if with_repr else row.get_values_tuple())
+            if row._repr_bit_list:
+                table_rows.extend([bit.get_tuple() if with_repr
+                                   else bit.get_values_tuple()
+                                   for bit in row._repr_bit_list])
+        return table_rows
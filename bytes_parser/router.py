@@ -0,0 +1,92 @@
+from collections.abc import Sequence
+from typing import Any, Literal
+
+from loguru import logger
+
+from bytes_parser.frame import Frame
+from bytes_parser.output import Output
+
+
+class FrameRouter:
+    def __init__(self, frames: Sequence[Frame] = (),
+                 id_offset: int | None = None, id_size: int = 1,
+                 byte_order: Literal['big', 'little'] = 'big') -> None:
+        self.id_offset: int | None = id_offset
+        self.id_size: int = id_size
+        self.byte_order: Literal['big', 'little'] = byte_order
+        self.default: Frame | None = None
+        self._by_size: dict[int, Frame] = {}
+        self._by_id: dict[int, Frame] = {}
+        self._by_sync: dict[bytes, Frame] = {}
+        self._sync_sizes: list[int] = []
+        for frame in frames:
+            self.register(frame)
+
+    def register(self, frame: Frame, frame_id: int | None = None,
+                 sync: bytes | str | None = None) -> "FrameRouter":
+        if isinstance(sync, str):
+            sync = bytes.fromhex(sync)
+        if sync:
+            self._add(self._by_sync, sync, frame, 'sync word')
+            if len(sync) not in self._sync_sizes:
+                self._sync_sizes.append(len(sync))
+        elif frame_id is not None:
+            if self.id_offset is None:
+                raise ValueError('FrameRouter id_offset is not set')
+            self._add(self._by_id, frame_id, frame, 'id')
+        elif frame.full_size == 0:
+            if self.default is not None:
+                raise ValueError(f'Default frame already registered: '\
+                                 f'{self.default.frame_type}')
+            self.default = frame
+        else:
+            self._add(self._by_size, frame.full_size, frame, 'size')
+        return self
+
+    @staticmethod
+    def _add(index: dict, key: int | bytes, frame: Frame, name: str) -> None:
+        if key in index:
+            raise ValueError(f'Frame {frame.frame_type} has the same {name} '\
+                             f'{key!r} as {index[key].frame_type}')
+        index[key] = frame
+
+    def route(self, raw_data: bytes) -> Frame | None:
+        for size in self._sync_sizes:
+            frame: Frame | None = self._by_sync.get(raw_data[:size], None)
+            if frame:
+                return frame
+        if self._by_id and self.id_offset is not None:
+            frame_id: int = int.from_bytes(
+                raw_data[self.id_offset: self.id_offset + self.id_size],
+                self.byte_order)
+            frame = self._by_id.get(frame_id, None)
+            if frame:
+                return frame
+        return self._by_size.get(len(raw_data), self.default)
+
+    def parse(self, raw_data: bytes | str, output: Output = 'dataframe') -> Any:
+        if isinstance(raw_data, str):
+            raw_data = bytes.fromhex(raw_data)
+        frame: Frame | None = self.route(raw_data)
+        if frame is None:
+            logger.warning(f'Frame for raw_data ({len(raw_data)}) not found')
+            return None
+        return frame.parse(raw_data, output)
+
+    def parse_table(self, raw_rows: Sequence[bytes] | Sequence[str],
+                    engine: Literal['python', 'numpy'] = 'python',
+                    output: Output = 'dataframe') -> dict[str, tuple[Any, Any]]:
+        groups: dict[str, tuple[Frame, list[bytes]]] = {}
+        skipped: int = 0
+        for line in raw_rows:
+            raw_data: bytes = bytes.fromhex(line) if isinstance(line, str) \
+                              else line
+            frame: Frame | None = self.route(raw_data)
+            if frame is None:
+                skipped += 1
+                continue
+            groups.setdefault(frame.frame_type, (frame, []))[1].append(raw_data)
+        if skipped:
+            logger.warning(f'Skipped {skipped} frames without route')
+        return {frame_type: frame.parse_table(frames, engine, output)
+                for frame_type, (frame, frames) in groups.items()}
@@ -1,28 +1,47 @@
-from collections.abc import Iterable, Sequence
+from collections.abc import Iterable
 from dataclasses import dataclass, field
+from time import perf_counter
 from typing import TYPE_CHECKING, Any, Literal, Protocol
 
-from bytes_parser.bitfields import BitField, BitFlag
-from bytes_parser.default_handlers import bit_fields, parse, represent, validate
+from bytes_parser.bitfields import BitField, BitFlag, BitPlan
+from bytes_parser.cache import NULL_ERRORS, CacheInfo, RowCache
+from bytes_parser.default_handlers import (
+    bit_fields,
+    changed_bits,
+    parse,
+    represent,
+    validate,
+)
+from bytes_parser.profiler import Profiler
+from bytes_parser.result import (
+    BitResult,
+    ErrorCounter,
+    FrameResult,
+    RowResult,
+    forward_attributes,
+)
 
 if TYPE_CHECKING:
     from bytes_parser import Frame
 
 
 class Parser(Protocol):
-    def __call__(self, field: "Row", *args: Any, **kwds: Any) -> int | float:
+    def __call__(self, field: RowResult, *args: Any,
+                 **kwds: Any) -> int | float:
         ...
 
 class Representer(Protocol):
-    def __call__(self, field: "Row", *args: Any, **kwds: Any) -> str:
+    def __call__(self, field: RowResult, *args: Any,
+                 **kwds: Any) -> str:
         ...
 
 class Validator(Protocol):
-    def __call__(self, field: "Row", *args: Any, **kwds: Any) -> bool:
+    def __call__(self, field: RowResult, *args: Any,
+                 **kwds: Any) -> bool:
         ...
 
 
-@dataclass
+@dataclass(slots=True)
 class Row:
     label: str
     size: int
@@ -38,14 +57,14 @@ class Row:
     bit_fields: list[BitField | BitFlag] = field(default_factory=list)
     signed: bool = False
     prefix: str | None = ''
-    _errors: int = 0
-    _is_valid: bool = True
-    raw_val: bytes = b''
-    _parsed_val: int | float = 0
+    cache_size: int = 0
     _offset: int = 0
+    _column: int = 0
     _parent_frame: 'Frame | None' = None
-    _repr_bit_list: Sequence[BitField | BitFlag] = field(default_factory=list)
-    _repr_data: str = ''
+    _bit_plan: BitPlan = None  # type: ignore
+    _cache: RowCache[RowResult] | None = None
+    _copy_raw: bool = False
+    _width: int = 1
 
     def _set_byte_order(self, byte_order: Literal['big', 'little']) -> None:
         self.byte_order = byte_order
@@ -65,35 +84,157 @@ class Row:
                 self.str_format = 'b'
 
     def clear_errors(self) -> None:
-        self._errors = 0
-        for bit in self.bit_fields:
-            bit.errors = 0
+        if self._parent_frame is not None:
+            self._parent_frame.errors.clear(
+                range(self._column,
+                      self._column + self._width + len(self.bit_fields)))
 
-    def _parse(self, raw_data: bytes, all_bits: bool = False):
+    def _parse(self, raw_data: bytes, errors: ErrorCounter,
+               all_bits: bool = False,
+               parent: FrameResult | None = None) -> RowResult:
         if self.size > 0:
-            self.raw_val = raw_data[self._offset: self._offset + self.size]
-            if len(self.bit_fields) > 0:
-                self._repr_bit_list = bit_fields(self, all_bits)
+            raw_val: bytes = raw_data[self._offset: self._offset + self.size]
         else:
-            self.raw_val = raw_data[self._offset:]
-        if self.kwargs and self.args:
-            self._parsed_val = self.parser(self, *self.args, **self.kwargs)
-            self._is_valid = self.validator(self, *self.args, **self.kwargs)
-            self._repr_data = self.representer(self, *self.args, **self.kwargs)
-        elif self.args:
-            self._parsed_val = self.parser(self, *self.args)
-            self._is_valid = self.validator(self, *self.args)
-            self._repr_data = self.representer(self, *self.args)
-        elif self.kwargs:
-            self._parsed_val = self.parser(self, **self.kwargs)
-            self._is_valid = self.validator(self, **self.kwargs)
-            self._repr_data = self.representer(self, **self.kwargs)
+            raw_val = raw_data[self._offset:]
+        if self._copy_raw and not isinstance(raw_val, bytes):
+            # custom handlers get bytes, default ones decode views in place
+            raw_val = bytes(raw_val)
+        if self._cache is not None:
+            return self._parse_cached(raw_val, None, errors, all_bits, parent)
+        return self._decode(raw_val, None, errors, all_bits, parent)
+
+    def _parse_value(self, raw_data: bytes, value: float,
+                     errors: ErrorCounter, all_bits: bool = False,
+                     parent: FrameResult | None = None) -> RowResult:
+        # value already unpacked by Frame struct plan; default handlers only,
+        # so results do not reference the parent (no reference cycle to
+        # collect for every parsed frame)
+        raw_val: bytes = raw_data[self._offset: self._offset + self.size]
+        if self._cache is not None:
+            return self._parse_cached(raw_val, value, errors, all_bits, None)
+        if self.bit_fields:
+            return self._decode(raw_val, value, errors, all_bits, None)
+        result = RowResult(self, raw_val)
+        result._parsed_val = value
+        if self.min_value <= value <= self.max_value:
+            result._errors = errors.counts[self._column]
+        else:
+            result._is_valid = False
+            result._errors = errors.add(self._column)
+        return result
+
+    def _decode(self, raw_val: bytes, value: float | None,
+                errors: ErrorCounter, all_bits: bool,
+                parent: FrameResult | None) -> RowResult:
+        result = RowResult(self, raw_val, parent)
+        if self.size > 0 and len(self.bit_fields) > 0:
+            result._repr_bit_list = bit_fields(self, raw_val, errors, all_bits)
+        if value is None:
+            result._parsed_val = self.parser(result, *self.args, **self.kwargs)
+            result._is_valid = self.validator(result, *self.args, **self.kwargs)
         else:
-            self._parsed_val = self.parser(self)
-            self._is_valid = self.validator(self)
-            self._repr_data = self.representer(self)
-        if not self._is_valid:
-            self._errors += 1
-        return (self.label, self._repr_data, self._parsed_val,
-                f'0x{self.raw_val.hex().upper()}',
-                self._is_valid, self._errors)
+            result._parsed_val = value
+            result._is_valid = self.min_value <= value <= self.max_value
+        if not result._is_valid:
+            result._errors = errors.add(self._column)
+        else:
+            result._errors = errors[self._column]
+        return result
+
+    def _parse_cached(self, raw_val: bytes, value: float | None,
+                      errors: ErrorCounter, all_bits: bool,
+                      parent: FrameResult | None) -> RowResult:
+        if not isinstance(raw_val, bytes):
+            raw_val = bytes(raw_val)
+        cached: RowResult | None = self._cache.get(raw_val)  # type: ignore
+        if cached is None:
+            cached = self._decode(raw_val, value, NULL_ERRORS, True, None)
+            self._cache.put(raw_val, cached)  # type: ignore
+        result = RowResult(self, raw_val, parent)
+        result._parsed_val = cached._parsed_val
+        result._is_valid = cached._is_valid
+        result._repr_cache = cached._repr_cache
+        result._cached = cached
+        if not result._is_valid:
+            result._errors = errors.add(self._column)
+        else:
+            result._errors = errors[self._column]
+        for cached_bit in cached._repr_bit_list:
+            if cached_bit.is_valid and not all_bits and \
+               cached_bit.show != 'always' and \
+               isinstance(cached_bit.bit, BitFlag):
+                continue
+            bit = BitResult(cached_bit.bit)
+            bit._value = cached_bit._value
+            bit._raw = cached_bit._raw
+            bit._repr_cache = cached_bit._repr_cache
+            bit._cached = cached_bit
+            bit.is_valid = cached_bit.is_valid
+            if not bit.is_valid:
+                bit.errors = errors.add(bit.bit._column)
+            else:
+                bit.errors = errors[bit.bit._column]
+            result._repr_bit_list.append(bit)
+        return result
+
+    def _parse_profiled(self, raw_data: bytes, value: float | None,
+                        errors: ErrorCounter, all_bits: bool,
+                        parent: FrameResult, profiler: Profiler) -> RowResult:
+        if self._cache is not None:
+            start: float = perf_counter()
+            if value is None:
+                result: RowResult = self._parse(raw_data, errors, all_bits,
+                                                parent)
+            else:
+                result = self._parse_value(raw_data, value, errors, all_bits,
+                                           parent)
+            profiler.record(self.label, 'cache', perf_counter() - start,
+                            not result._is_valid)
+            result._profiler = profiler
+            return result
+        if self.size > 0:
+            raw_val: bytes = raw_data[self._offset: self._offset + self.size]
+        else:
+            raw_val = raw_data[self._offset:]
+        if self._copy_raw and not isinstance(raw_val, bytes):
+            raw_val = bytes(raw_val)
+        result = RowResult(self, raw_val, parent)
+        result._profiler = profiler
+        if self.size > 0 and len(self.bit_fields) > 0:
+            start = perf_counter()
+            result._repr_bit_list = bit_fields(self, raw_val, errors, all_bits)
+            profiler.record(self.label, 'bits', perf_counter() - start,
+                            any(not bit.is_valid
+                                for bit in result._repr_bit_list))
+        start = perf_counter()
+        if value is None:
+            result._parsed_val = self.parser(result, *self.args, **self.kwargs)
+            profiler.record(self.label, 'parser', perf_counter() - start)
+            start = perf_counter()
+            result._is_valid = self.validator(result, *self.args, **self.kwargs)
+        else:
+            result._parsed_val = value
+            result._is_valid = self.min_value <= value <= self.max_value
+        profiler.record(self.label, 'validator', perf_counter() - start,
+                        not result._is_valid)
+        if not result._is_valid:
+            result._errors = errors.add(self._column)
+        else:
+            result._errors = errors[self._column]
+        return result
+
+    def cache_info(self) -> CacheInfo | None:
+        if self._cache is None:
+            return None
+        return self._cache.info()
+
+    def _parse_changed_bits(self, raw_data: bytes, previous: bytes | None,
+                            errors: ErrorCounter) -> list[BitResult]:
+        raw_val: bytes = raw_data[self._offset: self._offset + self.size]
+        prev_raw: bytes | None = None
+        if previous is not None:
+            prev_raw = previous[self._offset: self._offset + self.size]
+        return changed_bits(self, raw_val, prev_raw, errors)
+
+
+forward_attributes(RowResult, 'row', Row.__slots__)
@@ -0,0 +1,47 @@
+import mmap
+import socket
+from collections.abc import Iterator
+from typing import BinaryIO
+
+from loguru import logger
+
+Source = BinaryIO | mmap.mmap | socket.socket
+
+
+def read_exactly(source: Source, size: int) -> bytes:
+    if isinstance(source, socket.socket):
+        buffer = bytearray(size)
+        view = memoryview(buffer)
+        received: int = 0
+        while received < size:
+            count: int = source.recv_into(view[received:])
+            if not count:
+                break
+            received += count
+        return bytes(buffer[:received])
+    data: bytes = source.read(size)
+    while data and len(data) < size:
+        chunk: bytes = source.read(size - len(data))
+        if not chunk:
+            break
+        data += chunk
+    return data
+
+
+def iter_frames(source: Source, frame_size: int,
+                frames_per_block: int = 1) -> Iterator[list[bytes]]:
+    if frame_size <= 0:
+        raise ValueError(f'Incorrect frame size {frame_size} for stream reading')
+    block_size: int = frame_size * max(frames_per_block, 1)
+    while True:
+        block: bytes = read_exactly(source, block_size)
+        tail: int = len(block) % frame_size
+        if tail:
+            logger.warning(f'Skipped incomplete frame at the end of the '\
+                           f'stream ({tail} of {frame_size} bytes)')
+            block = block[:-tail]
+        if block:
+            yield [block[i: i + frame_size]
+                   for i in range(0, len(block), frame_size)]
+        if len(block) + tail < block_size:
+            return
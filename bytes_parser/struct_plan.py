@@ -0,0 +1,62 @@
+import struct
+from collections import Counter
+from collections.abc import Container
+from typing import TYPE_CHECKING, Literal
+
+from bytes_parser.default_handlers import parse, represent, validate
+
+if TYPE_CHECKING:
+    from bytes_parser.row import Row
+
+
+_INT_CODES: dict[int, str] = {1: 'b', 2: 'h', 4: 'i', 8: 'q'}
+
+
+def is_default_row(row: "Row") -> bool:
+    return (row.parser is parse and row.validator is validate
+            and row.representer is represent)
+
+
+def struct_code(row: "Row") -> str | None:
+    if not is_default_row(row):
+        return None
+    if 'f' in row.str_format and row.size == 4:
+        return 'f'
+    code: str | None = _INT_CODES.get(row.size, None)
+    if code is None:
+        return None
+    return code if row.signed else code.upper()
+
+
+class StructPlan:
+    # rows with custom handlers are skipped with pad bytes (slow path),
+    # rows not in selected (row indices) are skipped as well
+    def __init__(self, rows: list["Row"],
+                 selected: Container[int] | None = None) -> None:
+        codes: list[str | None] = [struct_code(row)
+                                   if selected is None or i in selected
+                                   else None for i, row in enumerate(rows)]
+        orders: Counter[str] = Counter(row.byte_order for row, code
+                                       in zip(rows, codes) if code)
+        self.byte_order: Literal['big', 'little'] = 'big'
+        if orders:
+            self.byte_order = orders.most_common(1)[0][0]  # type: ignore
+        fmt: list[str] = [('<', '>')[self.byte_order == 'big']]
+        self.index: list[int] = []
+        count: int = 0
+        for row, code in zip(rows, codes):
+            if code and row.byte_order == self.byte_order:
+                fmt.append(code)
+                self.index.append(count)
+                count += 1
+            else:
+                if row.size > 0:
+                    fmt.append(f'{row.size}x')
+                self.index.append(-1)
+        self.count: int = count
+        self.struct: struct.Struct = struct.Struct(''.join(fmt))
+
+    def unpack(self, raw_data: bytes) -> tuple | None:
+        if not self.count or len(raw_data) < self.struct.size:
+            return None
+        return self.struct.unpack_from(raw_data)
@@ -1,7 +1,7 @@
 
 
 
-from copy import deepcopy
+from copy import copy
 from typing import Literal
 
 from bytes_parser.row import Row
@@ -13,7 +13,7 @@ class SubFrame:
                  postfix: str = '') -> None:
         self.prefix: str = prefix
         self.postfix: str = postfix
-        self.rows: list[Row] = deepcopy(rows)
+        self.rows: list[Row] = [_copy_row(row) for row in rows]
         if byte_order is not None:
             for row in self.rows:
                 if not row.byte_order:
@@ -33,3 +33,11 @@ class SubFrame:
             self._index += 1
             return var
         raise StopIteration
+
+
+def _copy_row(row: Row) -> Row:
+    # rows and bit fields are bound to a frame, handlers and args are shared
+    new_row: Row = copy(row)
+    new_row.kwargs = dict(row.kwargs)
+    new_row.bit_fields = [copy(bit) for bit in row.bit_fields]
+    return new_row
@@ -0,0 +1,251 @@
+from collections.abc import Container, Sequence
+from itertools import compress
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+from loguru import logger
+
+from bytes_parser.array_row import RowArray
+from bytes_parser.bitfields import BitField, BitFlag
+from bytes_parser.checksum import ChecksumValidator
+from bytes_parser.default_handlers import parse, parse_bit_field
+from bytes_parser.projection import LazyFrameResult, Where
+from bytes_parser.result import BitResult, ErrorCounter, RowResult
+from bytes_parser.struct_plan import is_default_row, struct_code
+
+if TYPE_CHECKING:
+    from bytes_parser.frame import Frame
+    from bytes_parser.row import Row
+
+
+def _dtype_code(row: "Row") -> str | None:
+    code: str | None = struct_code(row)
+    if code is None:
+        return None
+    order: str = ('<', '>')[row.byte_order == 'big']
+    if code == 'f':
+        return f'{order}f4'
+    kind: str = ('u', 'i')[code.islower()]
+    return f'{order}{kind}{row.size}'
+
+
+def _as_uint(matrix: np.ndarray, row: "Row") -> np.ndarray:
+    columns: np.ndarray = matrix[:, row._offset: row._offset + row.size]
+    if row.byte_order == 'little':
+        columns = columns[:, ::-1]
+    result: np.ndarray = np.zeros(len(matrix), dtype=np.uint64)
+    for i in range(row.size):
+        result = (result << np.uint64(8)) | columns[:, i].astype(np.uint64)
+    return result
+
+
+def _as_int(matrix: np.ndarray, row: "Row") -> np.ndarray:
+    result: np.ndarray = _as_uint(matrix, row)
+    if not row.signed:
+        return result
+    bits: int = row.size * 8
+    result = result.astype(np.int64)
+    return np.where(result >= 1 << (bits - 1), result - (1 << bits), result)
+
+
+def _normalize(column: np.ndarray) -> np.ndarray:
+    if column.dtype.kind == 'f':
+        with np.errstate(invalid='ignore'):
+            return column.astype(np.float64)
+    if column.dtype.kind == 'u' and column.size and \
+       column.max() >= np.iinfo(np.int64).max:
+        return column.astype(np.uint64)
+    return column.astype(np.int64)
+
+
+def _python_bits(row: "Row", uint_vals: np.ndarray, bit: BitField,
+                 errors: ErrorCounter, column: int) -> tuple[list, list]:
+    # custom BitField parser/validator are called per element
+    values: list[Any] = []
+    valid: list[bool] = []
+    for val in uint_vals.tolist():
+        result: BitResult = parse_bit_field(bit, val, row.byte_order,
+                                            errors, column)
+        values.append(result._value)
+        valid.append(result.is_valid)
+    return values, valid
+
+
+def _vector_bits(row: "Row", uint_vals: np.ndarray, errors: ErrorCounter,
+                 values: list, valid: list,
+                 selected: Container[int] | None = None) -> None:
+    for column, bit in enumerate(row.bit_fields, row._column + 1):
+        if selected is not None and column not in selected:
+            values.append(None)
+            valid.append(None)
+            continue
+        if isinstance(bit, BitFlag):
+            bit_vals: np.ndarray = (uint_vals >> np.uint64(bit.pos)) & \
+                                   np.uint64(1)
+            is_valid: np.ndarray = bit_vals == int(bit.ok_condition)
+        elif isinstance(bit, BitField):
+            if bit.parser or bit.validator:
+                bit_values, bit_valid = _python_bits(row, uint_vals, bit,
+                                                     errors, column)
+                values.append(bit_values)
+                valid.append(bit_valid)
+                continue
+            mask: np.uint64 = np.uint64((1 << bit.length) - 1)
+            bit_vals = (uint_vals >> np.uint64(bit.pos)) & mask
+            is_valid = (bit.min_value < bit_vals) & (bit_vals < bit.max_value)
+        else:
+            raise TypeError(f'Incorrect bitfield type: {type(bit)}')
+        errors.add(column, int(np.count_nonzero(~is_valid)))
+        values.append(bit_vals.astype(np.int64))
+        valid.append(is_valid)
+
+
+def _python_row(frame: "Frame", index: int, frames: list[bytes],
+                errors: ErrorCounter, values: list, valid: list) -> None:
+    # parent result gives handlers the whole frame and the rows before this
+    # one, as parse() does
+    row: Row = frame.rows[index]
+    row_values: list[Any] = []
+    row_valid: list[bool] = []
+    bits_values: list[list[Any]] = [[] for _ in row.bit_fields]
+    bits_valid: list[list[bool]] = [[] for _ in row.bit_fields]
+    for raw_data in frames:
+        result: RowResult = row._parse(raw_data, errors, all_bits=True,
+                                       parent=LazyFrameResult(frame, raw_data,
+                                                              index))
+        row_values.append(result._parsed_val)
+        row_valid.append(result._is_valid)
+        for i, bit in enumerate(result._repr_bit_list):
+            bits_values[i].append(bit._value)
+            bits_valid[i].append(bit.is_valid)
+    values.append(row_values)
+    valid.append(row_valid)
+    values.extend(bits_values)
+    valid.extend(bits_valid)
+
+
+def _vector_array(row: RowArray, buffer: bytes | memoryview, size: int,
+                  errors: ErrorCounter, values: list, valid: list) -> None:
+    count: int = len(row._elements)
+    records: np.ndarray = np.frombuffer(buffer, dtype=np.dtype({
+        'names': [f'e{j}' for j in range(count)],
+        'formats': [_dtype_code(element) for element in row._elements],
+        'offsets': [row._offset + offset for offset in row._element_offsets],
+        'itemsize': size
+    }))
+    columns: list[np.ndarray] = [records[f'e{j}'] for j in range(count)]
+    checks: list[np.ndarray] = [(low <= column) & (column <= high)
+                                for column, low, high
+                                in zip(columns, row._mins, row._maxs)]
+    if row.expand:
+        for column, is_valid in enumerate(checks, row._column):
+            errors.add(column, int(np.count_nonzero(~is_valid)))
+        values.extend(_normalize(column) for column in columns)
+        valid.extend(checks)
+        return
+    is_valid = np.logical_and.reduce(checks)
+    errors.add(row._column, int(np.count_nonzero(~is_valid)))
+    values.append(list(zip(*[_normalize(column).tolist()
+                             for column in columns])))
+    valid.append(is_valid)
+
+
+def parse_columns(frame: "Frame", frames: list[bytes],
+                  errors: ErrorCounter,
+                  capture: memoryview | None = None,
+                  selected: Container[int] | None = None
+                  ) -> tuple[list, list] | None:
+    # columns not in selected (table header indices) are left as None
+    if not frames:
+        return None
+    size: int = len(frames[0])
+    if size < frame.full_size or any(len(raw) != size for raw in frames):
+        return None
+    if size != frame.full_size:
+        logger.warning(f'Frame {frame.frame_type} size ({frame.full_size}) '\
+                       f'and raw_data ({size}) are different!')
+    buffer: bytes | memoryview = b''.join(frames) if capture is None \
+                                  else capture
+    matrix: np.ndarray = np.frombuffer(buffer, dtype=np.uint8)\
+        .reshape(len(frames), size)
+    names: list[str] = []
+    formats: list[str] = []
+    offsets: list[int] = []
+    for i, row in enumerate(frame.rows):
+        code: str | None = _dtype_code(row)
+        if code:
+            names.append(f'f{i}')
+            formats.append(code)
+            offsets.append(row._offset)
+    records: np.ndarray = np.frombuffer(buffer, dtype=np.dtype({
+        'names': names, 'formats': formats,
+        'offsets': offsets, 'itemsize': size
+    }))
+    values: list = []
+    valid: list = []
+    for i, row in enumerate(frame.rows):
+        width: int = row._width + len(row.bit_fields)
+        if selected is not None and not any(
+                column in selected
+                for column in range(row._column, row._column + width)):
+            values.extend([None] * width)
+            valid.extend([None] * width)
+            continue
+        if isinstance(row, RowArray):
+            _vector_array(row, buffer, size, errors, values, valid)
+            continue
+        if isinstance(row.validator, ChecksumValidator) and \
+           row.parser is parse and 0 < row.size <= 8 and not row.bit_fields:
+            # checksums of all frames at once
+            row_vals = _as_int(matrix, row)
+            is_valid = row.validator.check(row, matrix, row_vals)
+            errors.add(row._column, int(np.count_nonzero(~is_valid)))
+            values.append(_normalize(row_vals))
+            valid.append(is_valid)
+            continue
+        if not (is_default_row(row) and 0 < row.size <= 8):
+            _python_row(frame, i, frames, errors, values, valid)
+            continue
+        if selected is not None and row._column not in selected:
+            values.append(None)
+            valid.append(None)
+        else:
+            if f'f{i}' in names:
+                row_vals: np.ndarray = records[f'f{i}']
+            else:
+                row_vals = _as_int(matrix, row)
+            is_valid: np.ndarray = (row.min_value <= row_vals) & \
+                                   (row_vals <= row.max_value)
+            errors.add(row._column, int(np.count_nonzero(~is_valid)))
+            values.append(_normalize(row_vals))
+            valid.append(is_valid)
+        if row.bit_fields:
+            _vector_bits(row, _as_uint(matrix, row), errors, values, valid,
+                         selected)
+    return values, valid
+
+
+def _compress(column: Sequence, keep: np.ndarray) -> Sequence:
+    if isinstance(column, np.ndarray):
+        return column[keep]
+    return list(compress(column, keep))
+
+
+def filter_columns(names: list[str], values: list[Sequence],
+                   valid: list[Sequence], where: Where | None
+                   ) -> tuple[list[Sequence], list[Sequence]]:
+    # predicate is called per frame with {column: value}, as in the python
+    # engine
+    if where is None:
+        return values, valid
+    count: int = len(values[0])
+    if where == 'failures':
+        keep: np.ndarray = ~np.logical_and.reduce(
+            [np.asarray(column, dtype=bool) for column in valid])
+    else:
+        rows = zip(*[column.tolist() if isinstance(column, np.ndarray)
+                     else column for column in values])
+        keep = np.fromiter((bool(where(dict(zip(names, row))))  # type: ignore
+                            for row in rows), dtype=bool, count=count)
+    return ([_compress(column, keep) for column in values],
+            [_compress(column, keep) for column in valid])
@@ -4,7 +4,8 @@ from collections.abc import Callable
 
 from pandas import DataFrame
 
-from bytes_parser import BitField, BitFlag, Frame, Row
+from bytes_parser import BitField, BitFlag, ChecksumValidator, Frame, FrameRouter, Row
+from bytes_parser.checksum import ALGORITHMS
 
 
 def get_field():
@@ -31,7 +32,7 @@ my_frame: Frame = Frame('my_frame_1', [
     Row("BITFIELD", 2, 'X',
         bit_fields=[*[BitFlag(i, f"BIT{i}", True) for i in range(10)],
                     BitField(10, "Counter", length=6, max_value=50)]),
-    Row('CRC8', 1, 'X'),
+    Row('CRC8', 1, 'X', validator=ChecksumValidator('crc8')),
 ], 'little')
 
 
@@ -59,18 +60,17 @@ unknown_frame: Frame = Frame('UndefinedFrame', [
 ], 'little')
 
 
-raw_data: bytes = random.randbytes(18)
+raw_data: bytes = random.randbytes(17)
+raw_data += bytes([ALGORITHMS['crc8'](raw_data)])
 raw_data2: bytes = random.randbytes(12)
 raw_data3: bytes = random.randbytes(18)
 
 
-def parse(data: bytes) -> DataFrame:
-    if len(data) == 18:
-        return my_frame.parse(data)
-    elif len(data) == 12:
-        return my_frame2.parse(data)
-    else:
-        return unknown_frame.parse(data)
+router = FrameRouter([my_frame, my_frame2, unknown_frame])
+
+
+def parse(data: bytes) -> DataFrame | None:
+    return router.parse(data)
 
 def parse_table(data: list[bytes]):
     return my_frame.parse_table(data)
@@ -83,4 +83,5 @@ print(parse(raw_data3))
 print(parse(b'gsdssf'))
 print(my_frame)
 print(combined_frame.from_frames(my_frame2, my_frame))
-print(parse_table([raw_data] * 8))
\ No newline at end of file
+print(parse_table([raw_data] * 8))
+print(router.parse_table([raw_data, raw_data2, raw_data3]))
\ No newline at end of file
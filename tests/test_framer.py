@@ -0,0 +1,70 @@
+import binascii
+
+from bytes_parser import Frame, Row
+from bytes_parser.framer import Framer
+
+
+def make_framer() -> Framer:
+    frame = Frame('P', [Row('SYNC', 2, 'X'), Row('LEN', 1), Row('CNT', 2),
+                        Row('DATA', 0, 'X')], 'big')
+    return Framer(frame, 'EB90', 'LEN', checksum='crc16_xmodem',
+                  checksum_size=2)
+
+
+def packet(count: int) -> bytes:
+    body: bytes = b'\xeb\x90\x0f' + count.to_bytes(2, 'big') + bytes(8)
+    return body + binascii.crc_hqx(body, 0).to_bytes(2, 'big')
+
+
+def test_false_sync_with_bogus_length():
+    # length 0xF0 is in range, but runs past the end of the data
+    packets: list[bytes] = [packet(i) for i in range(10)]
+    data: bytes = b'\xeb\x90\xf0' + b''.join(packets)
+    framer = make_framer()
+    assert framer.split(data).frames == packets
+    result = framer.split(data, final=True)
+    assert result.frames == packets
+    assert result.skipped == 3
+    assert result.tail == b''
+    assert framer.feed(data) == packets
+    assert framer.flush() == []
+    assert framer.skipped == 3
+    assert framer.frames_count == 10
+
+
+def test_false_sync_with_bogus_length_in_chunks():
+    packets: list[bytes] = [packet(i) for i in range(10)]
+    data: bytes = b'\xeb\x90\xf0' + b''.join(packets)
+    framer = make_framer()
+    frames: list[bytes] = []
+    for i in range(0, len(data), 7):
+        frames += framer.feed(data[i: i + 7])
+    frames += framer.flush()
+    assert frames == packets
+
+
+def test_false_sync_with_bogus_length_in_live_stream():
+    # 4 bytes length row: the candidate would wait for 61440 bytes
+    frame = Frame('P', [Row('SYNC', 2, 'X'), Row('LEN', 4), Row('CNT', 2),
+                        Row('DATA', 0, 'X')], 'big')
+    framer = Framer(frame, 'EB90', 'LEN', checksum='crc16_xmodem',
+                    checksum_size=2)
+    packets: list[bytes] = []
+    for i in range(2000):
+        body: bytes = b'\xeb\x90' + (18).to_bytes(4, 'big') + \
+            i.to_bytes(2, 'big') + bytes(8)
+        packets.append(body + binascii.crc_hqx(body, 0).to_bytes(2, 'big'))
+    data: bytes = b'\xeb\x90\x00\x00\xf0\x00' + b''.join(packets)
+    frames: list[bytes] = []
+    for i in range(0, len(data), 64):
+        frames += framer.feed(data[i: i + 64])
+        assert len(framer._buffer) < 64 + 18
+    assert frames == packets
+    assert framer.skipped == 6
+    assert framer.flush() == []
+
+
+def test_max_size():
+    assert make_framer().max_size == 255
+    frame = Frame('P', [Row('SYNC', 2, 'X'), Row('LEN', 4)], 'big')
+    assert Framer(frame, 'EB90', 'LEN').max_size == 65536
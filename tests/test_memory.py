@@ -0,0 +1,29 @@
+import tracemalloc
+
+from bytes_parser import BitField, BitFlag, Frame, Row
+
+
+def make_frame() -> Frame:
+    # 50 rows with 57 bits each and 50 plain rows
+    rows: list[Row] = []
+    for i in range(50):
+        bits: list[BitField | BitFlag] = [BitFlag(pos, f'F{pos}', True)
+                                          for pos in range(50)]
+        bits.extend(BitField(pos, f'B{pos}', 2) for pos in range(50, 64, 2))
+        rows.extend((Row(f'BITS{i}', 8, 'X', bit_fields=bits),
+                     Row(f'VALUE{i}', 2)))
+    return Frame('MEMORY', rows)
+
+
+def test_frame_definition_memory():
+    make_frame()
+    tracemalloc.start()
+    try:
+        before: int = tracemalloc.get_traced_memory()[0]
+        frame: Frame = make_frame()
+        size: int = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+    assert frame.full_size == 500
+    # ~860 KiB before slotted definitions and packed bit plans, ~660 KiB after
+    assert size < 720 * 1024